@@ -0,0 +1,105 @@
+import os
+import sys
+import csv
+import time
+import tempfile
+import frequent_itemset_miner
+from frequent_itemset_miner import create_itemset_store, fup_update, mine_itemsets, read_transactions
+
+BENCHMARKS = [
+    ("retail", 0.01),
+    ("retail", 0.005),
+    ("mushroom", 0.3),
+    ("chess", 0.8),
+]
+NEW_FRACTIONS = [0.01, 0.05, 0.1]
+FULL_ALGORITHMS = ["eclat", "apriori_pruning"]
+RESULTS_DIR = "results_experiment"
+OUTPUT_CSV = "incremental.csv"
+
+def split_dataset(filepath, new_fraction, directory):
+    """
+    Splits a dataset file into the transactions before an update and the transactions appended by it.
+
+    :param str filepath: Path to the dataset file
+    :param float new_fraction: Fraction of the transactions, at the end of the file, that are appended by the update
+    :param str directory: Directory in which the two parts are written
+    :return Tuple: path to the transactions before the update, path to the appended transactions, path to all of them
+    """
+    with open(filepath) as f:
+        lines = [line for line in f if line.strip()]
+    split = len(lines) - max(1, int(len(lines) * new_fraction))
+
+    paths = [os.path.join(directory, name) for name in ("old.dat", "new.dat", "full.dat")]
+    for path, part in zip(paths, (lines[:split], lines[split:], lines)):
+        with open(path, "w") as f:
+            f.writelines(part)
+    return paths
+
+def run_benchmark(dataset, threshold, new_fraction):
+    """
+    Compares the FUP update of the itemsets of a dataset with a full re-mining of the updated dataset.
+
+    :param str dataset: Name of the dataset
+    :param float threshold: Minimum frequency
+    :param float new_fraction: Fraction of the transactions appended by the update
+    :return list: One row per method, with its time, the number of itemsets and whether they match the FUP result
+    """
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        frequent_itemset_miner.RESULT_STORE_DIR = os.path.join(directory, "store")
+        old_path, new_path, full_path = split_dataset(f"Datasets/{dataset}/{dataset}.dat", new_fraction, directory)
+        create_itemset_store(old_path, threshold)
+
+        stats = {}
+        start_time = time.time()
+        store = fup_update(old_path, new_path, threshold, False, True, stats)
+        fup_time = time.time() - start_time
+        fup_itemsets = {tuple(sorted(itemset)): frequency for itemset, frequency in store.itemsets()}
+        rows.append([dataset, threshold, new_fraction, "fup", round(fup_time, 6), len(fup_itemsets),
+                     stats["rescanned"], stats["old_scans"], True])
+
+        for algorithm in FULL_ALGORITHMS:
+            start_time = time.time()
+            transactions, num_transactions = read_transactions(full_path, use_cache=False)
+            itemsets = {tuple(sorted(itemset)): frequency
+                        for itemset, frequency in mine_itemsets(transactions, num_transactions,
+                                                                threshold * num_transactions, algorithm)}
+            full_time = time.time() - start_time
+            matches = itemsets.keys() == fup_itemsets.keys() and all(
+                abs(frequency - fup_itemsets[itemset]) < 1e-12 for itemset, frequency in itemsets.items())
+            rows.append([dataset, threshold, new_fraction, algorithm, round(full_time, 6), len(itemsets), "", "",
+                         matches])
+    return rows
+
+def run_benchmarks(benchmarks):
+    """
+    Runs the benchmarks for every fraction of appended transactions, and saves the results in a CSV file.
+
+    :param list[Tuple] benchmarks: Dataset names and minimum frequencies
+    """
+    results = []
+    for dataset, threshold in benchmarks:
+        for new_fraction in NEW_FRACTIONS:
+            for row in run_benchmark(dataset, threshold, new_fraction):
+                print(", ".join(str(value) for value in row))
+                results.append(row)
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = os.path.join(RESULTS_DIR, OUTPUT_CSV)
+    with open(output_path, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["dataset", "threshold", "new_fraction", "method", "time", "itemsets", "rescanned",
+                         "old_scans", "matches_fup"])
+        writer.writerows(results)
+
+    print(f"Results saved to {output_path}")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        run_benchmarks([(sys.argv[1], float(sys.argv[2]))])
+    elif len(sys.argv) == 1:
+        run_benchmarks(BENCHMARKS)
+    else:
+        print("Usage: python benchmark_incremental.py <dataset_name(optional)> <threshold(optional)>")
+        sys.exit(1)
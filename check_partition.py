@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+import random
+import resource
+import tempfile
+from frequent_itemset_miner import mine_itemsets, partition_itemsets, read_transactions
+
+NUM_TRANSACTIONS = 200000
+NUM_ITEMS = 1000
+NUM_PATTERNS = 50
+THRESHOLD = 0.01
+MEMORY_BUDGET = 8 * 1024 * 1024
+
+def generate_synthetic_dataset(filepath, num_transactions, seed=0):
+    """
+    Writes a synthetic basket dataset, in the spirit of the IBM Quest generator: each transaction holds one or two
+    patterns, drawn from a fixed set of frequent patterns, plus a few random items.
+
+    :param str filepath: Path of the dataset file to write
+    :param int num_transactions: Number of transactions
+    :param int seed: Seed of the random generator
+    """
+    rng = random.Random(seed)
+    patterns = [rng.sample(range(NUM_ITEMS), rng.randint(2, 6)) for _ in range(NUM_PATTERNS)]
+    weights = [1 / (rank + 1) for rank in range(NUM_PATTERNS)]
+
+    with open(filepath, "w") as f:
+        for _ in range(num_transactions):
+            transaction = set()
+            for pattern in rng.choices(patterns, weights, k=rng.randint(1, 2)):
+                transaction.update(pattern)
+            transaction.update(rng.randrange(NUM_ITEMS) for _ in range(rng.randint(1, 8)))
+            f.write(" ".join(map(str, sorted(transaction))) + "\n")
+
+def peak_memory():
+    """Returns the peak resident memory of the process so far, in MB"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def check_partition(num_transactions):
+    """
+    Mines a synthetic dataset with the partition miner under a memory budget, then compares its result with the one of
+    ECLAT on the whole dataset loaded in memory.
+
+    :param int num_transactions: Number of transactions of the synthetic dataset
+    :return boolean: True if both results are the same
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, "synthetic.dat")
+        generate_synthetic_dataset(filepath, num_transactions)
+        print(f"Dataset of {num_transactions} transactions, {os.path.getsize(filepath) / 2**20:.1f} MB")
+
+        stats = {}
+        start_time = time.time()
+        actual = {tuple(sorted(itemset)): frequency for itemset, frequency in
+                  partition_itemsets(filepath, THRESHOLD, MEMORY_BUDGET, stats=stats)}
+        print(f"Partition: {len(actual)} itemsets, {stats['partitions']} partitions, {stats['candidates']} candidates, "
+              f"{time.time() - start_time:.2f}s, peak memory {peak_memory():.0f} MB")
+
+        start_time = time.time()
+        transactions, num_transactions = read_transactions(filepath, use_cache=False)
+        expected = {tuple(sorted(itemset)): frequency for itemset, frequency in
+                    mine_itemsets(transactions, num_transactions, THRESHOLD * num_transactions, "eclat_bitset")}
+        print(f"In memory: {len(expected)} itemsets, {time.time() - start_time:.2f}s, peak memory {peak_memory():.0f} MB")
+
+    return actual.keys() == expected.keys() and all(abs(frequency - expected[itemset]) < 1e-12
+                                                    for itemset, frequency in actual.items())
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        print("Usage: python check_partition.py <num_transactions(optional, default=200000)>")
+        sys.exit(1)
+
+    if check_partition(int(sys.argv[1]) if len(sys.argv) == 2 else NUM_TRANSACTIONS):
+        print("The partition miner found the same itemsets")
+    else:
+        print("The partition miner did not find the same itemsets")
+        sys.exit(1)
@@ -0,0 +1,64 @@
+import os
+import sys
+import csv
+import time
+from frequent_itemset_miner import apriori_no_pruning, apriori_pruning, eclat
+
+ALGORITHMS = {
+    "eclat": eclat,
+    "apriori_pruning": apriori_pruning,
+    "apriori_no_pruning": apriori_no_pruning,
+}
+THRESHOLDS = {
+    "chess": [0.9, 0.8, 0.75],
+    "mushroom": [0.5, 0.3, 0.2],
+    "retail": [0.05, 0.01, 0.005],
+}
+RESULTS_DIR = "results_experiment"
+OUTPUT_CSV = "item_order.csv"
+
+def count_nodes(algorithm, filepath, threshold, reorder):
+    """
+    Mines a dataset with the given algorithm, with or without the items renamed to ranks of ascending support.
+
+    :param str algorithm: Name of the algorithm, key of ALGORITHMS
+    :param str filepath: Path to the dataset file
+    :param float threshold: Minimum frequency
+    :param boolean reorder: Flag indicating whether the items are reordered by ascending support
+    :return Tuple: number of nodes of the search tree, elapsed time
+    """
+    stats = {}
+    start_time = time.time()
+    ALGORITHMS[algorithm](filepath, threshold, False, True, stats=stats, reorder=reorder)
+    return stats["nodes"], time.time() - start_time
+
+def compare_item_order(datasets):
+    """
+    Compares the number of nodes of the search tree and the mining time with and without the reordering of the items,
+    and saves them in a CSV file.
+
+    :param list[str] datasets: Names of the datasets, keys of THRESHOLDS
+    """
+    results = []
+    for dataset in datasets:
+        filepath = f"Datasets/{dataset}/{dataset}.dat"
+        for threshold in THRESHOLDS[dataset]:
+            for algorithm in ALGORITHMS:
+                nodes, elapsed_time = count_nodes(algorithm, filepath, threshold, False)
+                reordered_nodes, reordered_time = count_nodes(algorithm, filepath, threshold, True)
+                results.append((dataset, threshold, algorithm, nodes, reordered_nodes,
+                                round(elapsed_time, 6), round(reordered_time, 6)))
+                print(f"{dataset} {threshold} {algorithm}: {nodes} -> {reordered_nodes} nodes, "
+                      f"{elapsed_time:.2f}s -> {reordered_time:.2f}s")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = os.path.join(RESULTS_DIR, OUTPUT_CSV)
+    with open(output_path, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["dataset", "threshold", "algorithm", "nodes", "reordered_nodes", "time", "reordered_time"])
+        writer.writerows(results)
+
+    print(f"Results saved to {output_path}")
+
+if __name__ == "__main__":
+    compare_item_order(sys.argv[1:] if len(sys.argv) > 1 else list(THRESHOLDS))
@@ -1,6 +1,7 @@
 import os
 import csv
 from tqdm import tqdm
+from frequent_itemset_miner import load_dat_file
 
 DATASETS = ["accidents", "chess", "connect", "mushroom", "pumsb", "retail"]
 DATASETS_DIR = "Datasets"
@@ -13,22 +14,13 @@ def process_dataset(filepath):
     :param str filepath: Path to the dataset file
     :return Tuple: database name, unique item count, transaction count, density
     """
-    unique_items = set()
-    transaction_count = 0
-    total_items_count = 0
-
-    with open(filepath, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if line:
-                transaction = set(map(int, line.split()))
-                unique_items.update(transaction)
-                transaction_count += 1
-                total_items_count += len(transaction)
+    offsets, items, item_counts = load_dat_file(filepath)
+    transaction_count = len(offsets) - 1
+    total_items_count = len(items)
 
     database_name = os.path.splitext(os.path.basename(filepath))[0]
     
-    num_items = len(unique_items)
+    num_items = len(item_counts)
 
     density = total_items_count / (transaction_count * num_items) if num_items > 0 else 0
 
@@ -19,8 +19,30 @@ Do not change the signature of the apriori and alternative_miner methods as they
 
 __authors__ = Group23, Cyril Bousmar, Mohamed-Anass Gallass
 """
+import heapq
 import itertools
 import re
+import time
+
+DIFFSET_DENSITY = 0.1  # Density above which `eclat(tidsets="auto")` switches to diffsets
+HASH_TREE_LEAF_SIZE = 32  # Number of candidates above which a leaf of the Apriori hash tree is split
+BITMAP_BATCH_BYTES = 64 * 1024 * 1024  # Size of the intersections computed at once by `count_candidates_bitmap`
+SORT_OUTPUT = False  # Whether `manage_output` sorts the itemsets, instead of streaming them in the order they are mined
+OUTPUT_BUFFER_LINES = 4096  # Number of lines printed at once by `manage_output`
+OUTPUT_BUFFER_BYTES = 1024 * 1024  # Size of the buffer of the output files written by `manage_output`
+USE_DATASET_CACHE = True  # Whether `read_transactions` loads the datasets from their binary cache
+DATASET_CACHE_SUFFIX = ".cache"  # Suffix appended to the path of a dataset file to get the path of its binary cache
+DATASET_CACHE_MAGIC = b"FIMCSR01"
+DATASET_CACHE_HEADER = "<8sQqQQ"  # Magic, size and mtime (ns) of the dataset file, number of transactions and items
+RESULT_STORE_DIR = "solutions/store"  # Directory of the itemset stores written by `mine_stored`
+RESULT_STORE_MAGIC = b"FIMTRIE2"
+RESULT_STORE_HEADER = "<8sQdQQ"  # Magic, number of transactions, minimum support, number of nodes, log2 of index size
+SAMPLE_SIZE = 10000  # Number of transactions mined by `toivonen`
+SAMPLE_SLACK = 0.2  # Fraction by which `toivonen` lowers the minimum frequency on the sample
+PARTITION_MEMORY_BUDGET = 256 * 1024 * 1024  # Size of the transactions of a partition of `partition_miner`, in bytes
+CHUNK_PLAN_BLOCK = 1024 * 1024  # Number of transactions whose size is estimated at once by `iter_transaction_chunks`
+SPILL_MEMORY_BUDGET = 512 * 1024 * 1024  # Size of the tidsets kept in memory by `eclat(tidsets="spill")`, in bytes
+PHASE_TIMES = None  # Dictionary in which the time of the phases of a run is accumulated when set (see `add_phase_time`)
 
 class Dataset:
     """Utility class to manage a dataset stored in a external file."""
@@ -31,15 +53,12 @@ class Dataset:
         self.items = set()
 
         try:
-            lines = [line.strip() for line in open(filepath, "r")]
-            lines = [line for line in lines if line]  # Skipping blank lines
-            for line in lines:
-                transaction = list(map(int, line.split(" ")))
-                self.transactions.append(transaction)
-                for item in transaction:
-                    self.items.add(item)
+            offsets, items, item_counts = load_dat_file(filepath)
+            offsets, items = offsets.tolist(), items.tolist()
+            self.transactions = [items[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+            self.items = set(item_counts)
         except IOError as e:
-            print("Unable to read dataset file!\n" + e)
+            print("Unable to read dataset file!\n" + str(e))
 
     def trans_num(self):
         """Returns the number of transactions in the dataset"""
@@ -93,40 +112,405 @@ def compare_solution_files(expected_file, actual_file):
                 print(f"(Showed {len(to_show)} out of {len(excess)})")
 
 
-def read_transactions(filepath):
+def load_dat_file(filepath):
     """
-    Reads transactions from a dataset file and counts them.
+    Reads a text dataset file, one transaction of space-separated integer items per line, in a single pass.
+
+    With NumPy, the whole file is read as bytes and tokenized at once: the runs of digits are located, their values
+    computed one digit position at a time and assigned to the line they belong to, and duplicates inside a transaction
+    removed. Apart from the bytes of the file, the arrays built have one entry per item, not per byte. Without NumPy,
+    the lines are parsed one at a time. Blank lines are skipped.
+
+    :param filepath: Path to the transaction dataset file
+    :return offsets (sequence[int]): Offsets of the transactions in `items`, of length number of transactions + 1
+    :return items (sequence[int]): Sorted items of each transaction, one transaction after the other
+    :return item_counts (dict): Dictionary mapping each item to the number of transactions containing it
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        import array
+
+        offsets = array.array("q", [0])
+        items = array.array("i")
+        item_counts = {}
+        with open(filepath, 'r') as file:
+            for line in file:
+                transaction = sorted(set(map(int, line.split())))
+                if transaction:
+                    items.extend(transaction)
+                    offsets.append(len(items))
+                    for item in transaction:
+                        item_counts[item] = item_counts.get(item, 0) + 1
+        return offsets, items, item_counts
+
+    data = np.fromfile(filepath, dtype=np.uint8)
+    is_digit = (data >= ord("0")) & (data <= ord("9"))
+    boundaries = np.diff(is_digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    del is_digit
+    starts = np.flatnonzero(boundaries == 1)
+    lengths = (np.flatnonzero(boundaries == -1) - starts).astype(np.int32)
+    del boundaries
+    if len(starts) == 0:
+        return np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32), {}
+
+    # Value of each token, one digit position at a time, over the tokens that have a digit at that position
+    values = (data[starts] - ord("0")).astype(np.int64)
+    tokens = np.arange(len(starts), dtype=np.int32)
+    for position in range(1, int(lengths.max())):
+        tokens = tokens[lengths[tokens] > position]
+        values[tokens] = values[tokens] * 10 + (data[starts[tokens] + position] - ord("0"))
+    del tokens, lengths
+
+    # Line of each token, from the number of line breaks before it, then sorted and deduplicated per line
+    keys = np.searchsorted(np.flatnonzero(data == ord("\n")), starts)
+    del data, starts
+    num_values = int(values.max()) + 1
+    keys *= num_values
+    keys += values
+    del values
+    keys.sort()
+    is_first = np.empty(len(keys), dtype=bool)
+    is_first[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=is_first[1:])
+    lines, items = np.divmod(keys[is_first], num_values)
+    del keys, is_first
+
+    is_line_start = np.empty(len(lines), dtype=bool)
+    is_line_start[0] = True
+    np.not_equal(lines[1:], lines[:-1], out=is_line_start[1:])
+    offsets = np.append(np.flatnonzero(is_line_start), len(lines)).astype(np.int64)
+
+    counts = np.bincount(items)
+    unique_items = np.flatnonzero(counts)
+    return offsets, items.astype(np.int32), dict(zip(unique_items.tolist(), counts[unique_items].tolist()))
+
+
+def iter_transaction_chunks(filepath, memory_budget, csr=False):
+    """
+    Streams a text dataset file (see `load_dat_file`) as consecutive chunks of transactions, each of which takes at
+    most about `memory_budget` bytes once loaded, so that the file never needs to be held in memory as a whole.
+
+    With `csr`, when NumPy is available and the binary cache of the file is up to date (see `write_dataset_cache`),
+    the chunks are slices of the CSR layout of the memory-mapped cache instead, cut at the same transactions, so that
+    they are read in place rather than parsed. The cuts are found `CHUNK_PLAN_BLOCK` transactions at a time, so that
+    finding them takes the same memory whatever the size of the file.
+
+    :param filepath: Path to the transaction dataset file
+    :param int memory_budget: Size of the transactions of a chunk, in bytes, as estimated by `sys.getsizeof`
+    :param boolean csr: Flag indicating whether the chunks are read from the binary cache in their CSR layout (see
+        `read_transactions`) when possible (default: False)
+    :return chunks (generator): Lists of transactions, each represented as a frozenset of integer items, or CSR layouts
+    """
+    import sys
+
+    start_time = time.perf_counter()
+    if csr and USE_DATASET_CACHE:
+        try:
+            import numpy as np
+        except ImportError:
+            csr = False
+    offsets, items = load_dataset_cache(filepath) if csr and USE_DATASET_CACHE else (None, None)
+    if offsets is not None:
+        offsets, items = np.asarray(offsets), np.asarray(items)
+        num_transactions = len(offsets) - 1
+        set_sizes = np.zeros(0, dtype=np.int64)
+        start = 0
+        chunk_size = 0
+        for block_start in range(0, num_transactions, CHUNK_PLAN_BLOCK):
+            # Sizes of the chunk so far at the end of each transaction of the block, from the start of the chunk
+            lengths = np.diff(offsets[block_start:block_start + CHUNK_PLAN_BLOCK + 1])
+            if lengths.max() >= len(set_sizes):
+                set_sizes = np.array([sys.getsizeof(frozenset(range(length))) for length in range(lengths.max() + 1)])
+            ends = chunk_size + np.cumsum(set_sizes[lengths] + sys.getsizeof(1) * lengths)
+            while True:
+                end = int(np.searchsorted(ends, memory_budget, side="right"))
+                if end == len(lengths):
+                    break
+                end = block_start + max(end, start - block_start + 1)
+                add_phase_time("parse", start_time)
+                yield offsets[start:end + 1] - offsets[start], items[offsets[start]:offsets[end]]
+                start_time = time.perf_counter()
+                ends -= ends[end - block_start - 1] if end > block_start else chunk_size
+                start = end
+            chunk_size = ends[-1]
+        add_phase_time("parse", start_time)
+        if start < num_transactions:
+            yield offsets[start:] - offsets[start], items[offsets[start]:]
+        return
+
+    chunk = []
+    chunk_size = 0
+    with open(filepath, 'r') as file:
+        for line in file:
+            transaction = frozenset(map(int, line.split()))
+            if not transaction:
+                continue
+            transaction_size = sys.getsizeof(transaction) + sum(map(sys.getsizeof, transaction))
+            if chunk and chunk_size + transaction_size > memory_budget:
+                add_phase_time("parse", start_time)
+                yield chunk
+                start_time = time.perf_counter()
+                chunk = []
+                chunk_size = 0
+            chunk.append(transaction)
+            chunk_size += transaction_size
+    add_phase_time("parse", start_time)
+    if chunk:
+        yield chunk
+
+
+def transactions_from_csr(offsets, items):
+    """
+    Builds the list of transactions from their CSR layout.
+
+    :param sequence[int] offsets: Offsets of the transactions in `items`, of length number of transactions + 1
+    :param sequence[int] items: Items of each transaction, one transaction after the other
+    :return transactions (list[frozensets]): List of transactions, each represented as a frozenset of integer items
+    """
+    offsets = offsets.tolist()
+    items = items.tolist()
+    return [frozenset(items[offsets[i]:offsets[i + 1]]) for i in range(len(offsets) - 1)]
+
+
+def write_dataset_cache(filepath, offsets, items):
+    """
+    Writes the binary cache of a dataset file next to it, at `filepath + DATASET_CACHE_SUFFIX`.
+
+    The cache holds a header (magic, size and mtime of the dataset file, number of transactions and of items), followed
+    by the CSR layout of the transactions: the int64 offsets of each transaction, then the int32 items of all the
+    transactions one after the other, each transaction sorted.
+
+    :param filepath: Path to the transaction dataset file
+    :param sequence[int] offsets: Offsets of the transactions, as a buffer of int64 (see `load_dat_file`)
+    :param sequence[int] items: Items of the transactions, as a buffer of int32 (see `load_dat_file`)
+    """
+    import os
+    import struct
+
+    stat = os.stat(filepath)
+    cache_path = filepath + DATASET_CACHE_SUFFIX
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(struct.pack(DATASET_CACHE_HEADER, DATASET_CACHE_MAGIC, stat.st_size, stat.st_mtime_ns,
+                            len(offsets) - 1, len(items)))
+        f.write(memoryview(offsets).cast("B"))
+        f.write(memoryview(items).cast("B"))
+    os.replace(temporary_path, cache_path)
+
+
+def load_dataset_cache(filepath):
+    """
+    Memory-maps the binary cache of a dataset file (see `write_dataset_cache`), if it is up to date with the file.
+
+    :param filepath: Path to the transaction dataset file
+    :return offsets (memoryview): Offsets of the transactions in `items`, of length number of transactions + 1, or
+        None if there is no valid cache
+    :return items (memoryview): Items of all the transactions, or None if there is no valid cache
+    """
+    import mmap
+    import os
+    import struct
+
+    cache_path = filepath + DATASET_CACHE_SUFFIX
+    try:
+        stat = os.stat(filepath)
+        with open(cache_path, "rb") as f:
+            cache = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None, None
+
+    header_size = struct.calcsize(DATASET_CACHE_HEADER)
+    if len(cache) < header_size:
+        return None, None
+    magic, size, mtime_ns, num_transactions, num_items = struct.unpack_from(DATASET_CACHE_HEADER, cache)
+    offsets_end = header_size + 8 * (num_transactions + 1)
+    if (magic != DATASET_CACHE_MAGIC or size != stat.st_size or mtime_ns != stat.st_mtime_ns
+            or len(cache) != offsets_end + 4 * num_items):
+        return None, None
+
+    buffer = memoryview(cache)
+    return buffer[header_size:offsets_end].cast("q"), buffer[offsets_end:].cast("i")
+
+
+def parse_transactions(filepath):
+    """
+    Parses the transactions of a text dataset file line by line, without NumPy. This is faster than the fallback of
+    `load_dat_file`, as the transactions are built directly rather than through their CSR layout.
 
     :param filepath: Path to the transaction dataset file
     :return transactions (list[frozensets]): List of transactions, each represented as a frozenset of integer items
-    :return count (int): The total number of transactions read.
     """
     transactions = []
-    count = 0
     with open(filepath, 'r') as file:
         for line in file:
             line = line.strip()
             if line:
-                transaction = frozenset(map(int, line.split()))
-                transactions.append(transaction)
-                count += 1
+                transactions.append(frozenset(map(int, line.split())))
+    return transactions
+
+
+def read_transactions(filepath, use_cache=None, csr=False):
+    """
+    Reads transactions from a dataset file and counts them.
+
+    The transactions are loaded from the binary cache of the file when it is up to date, and the cache is (re)built
+    from the text file otherwise. With `csr`, the transactions are returned in their CSR layout, as NumPy arrays over
+    the memory-mapped cache, which the vertical database and bitmap builders consume without building any frozenset.
+    Without NumPy, the cache is left aside, as building the frozensets from it is no faster than parsing the text file
+    with `parse_transactions`.
+
+    :param filepath: Path to the transaction dataset file
+    :param boolean use_cache: Flag indicating whether the binary cache is used, with NumPy (default:
+        `USE_DATASET_CACHE`)
+    :param boolean csr: Flag indicating whether the transactions are returned as a tuple of their offsets and items
+        (see `write_dataset_cache`) rather than as a list, when NumPy is available (default: False)
+    :return transactions (list[frozensets] | tuple): List of transactions, each represented as a frozenset of integer
+        items, or their CSR layout
+    :return count (int): The total number of transactions read.
+    """
+    if use_cache is None:
+        use_cache = USE_DATASET_CACHE
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    start_time = time.perf_counter()
+    if np is None:
+        transactions = parse_transactions(filepath)
+        add_phase_time("parse", start_time)
+        return transactions, len(transactions)
+
+    offsets, items = load_dataset_cache(filepath) if use_cache else (None, None)
+    if offsets is None:
+        offsets, items, _ = load_dat_file(filepath)
+        if use_cache:
+            try:
+                write_dataset_cache(filepath, offsets, items)
+            except OSError:
+                pass
+
+    if csr:
+        transactions = (np.asarray(offsets), np.asarray(items))
+        count = len(offsets) - 1
+    else:
+        transactions = transactions_from_csr(offsets, items)
+        count = len(transactions)
+    add_phase_time("parse", start_time)
     return transactions, count
 
 
-def get_count_items(transactions):
+def is_csr(transactions):
+    """
+    Tells whether transactions are in their CSR layout (see `read_transactions`) rather than a list of frozensets.
+
+    :param list[frozenset] | tuple transactions: Transactions, as a list or in their CSR layout
+    :return is_csr (boolean): True if the transactions are a tuple of their offsets and items
+    """
+    return isinstance(transactions, tuple)
+
+
+def get_item_tids_csr(offsets, items):
+    """
+    Groups the TIDs of transactions in CSR layout by item, with NumPy.
+
+    :param numpy.ndarray offsets: Offsets of the transactions in `items`, of length number of transactions + 1
+    :param numpy.ndarray items: Items of each transaction, one transaction after the other
+    :return item_tids (generator): Tuples of an item and the sorted array of the TIDs of the transactions containing it
+    """
+    import numpy as np
+
+    tids = np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+    order = np.argsort(items, kind="stable")
+    sorted_items = items[order]
+    tids = tids[order]
+    starts = np.flatnonzero(np.diff(sorted_items, prepend=-1))
+    ends = np.append(starts[1:], len(sorted_items))
+    for item, start, end in zip(sorted_items[starts].tolist(), starts.tolist(), ends.tolist()):
+        yield item, tids[start:end]
+
+
+def get_count_items(transactions, weights=None):
     """
     Counts occurrences of each item in the list of transactions.
 
-    :param list[frozenset] transactions: List of transactions, each represented as a frozenset of items
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of items, or
+        their CSR layout (see `read_transactions`)
+    :param list[int] weights: Optional number of occurrences of each transaction (see `compress_transactions`)
     :return item_counts (dict): Dictionary mapping each item to its occurrence count
     """
+    if is_csr(transactions):
+        import numpy as np
+
+        counts = np.bincount(transactions[1])
+        unique_items = np.flatnonzero(counts)
+        return dict(zip(unique_items.tolist(), counts[unique_items].tolist()))
+
     item_counts = {}
-    for transaction in transactions:
-        for item in transaction:
-            item_counts[item] = item_counts.get(item, 0) + 1
+    if weights is None:
+        for transaction in transactions:
+            for item in transaction:
+                item_counts[item] = item_counts.get(item, 0) + 1
+    else:
+        for transaction, weight in zip(transactions, weights):
+            for item in transaction:
+                item_counts[item] = item_counts.get(item, 0) + weight
     return item_counts
 
 
+def compress_transactions(transactions, min_support):
+    """
+    Removes the infrequent items from the transactions, then merges the identical transactions into weighted rows.
+    Every itemset has the same support on the weighted rows as on the original transactions, as long as it is made of
+    frequent items.
+
+    :param list[frozenset] transactions: List of transactions, each represented as a frozenset of integer items
+    :param int min_support: Minimum support count for an item to be kept
+    :return rows (list[frozenset]): Distinct non-empty transactions left once the infrequent items are removed
+    :return weights (list[int]): Number of original transactions merged into each row
+    """
+    frequent_items = frozenset(item for item, count in get_count_items(transactions).items() if count >= min_support)
+    row_weights = {}
+    for transaction in transactions:
+        row = transaction & frequent_items
+        if row:
+            row_weights[row] = row_weights.get(row, 0) + 1
+    return list(row_weights.keys()), list(row_weights.values())
+
+
+def remap_items(transactions, min_support, weights=None):
+    """
+    Removes the infrequent items from the transactions, then renames the frequent ones to dense ranks, from 0 for the
+    least frequent item to the number of frequent items minus one for the most frequent. The miners then extend the
+    itemsets in ascending order of support, which keeps the equivalence classes of the search small, and the ranks can
+    index arrays directly. The original items are given back by `restore_items`.
+
+    :param list[frozenset] transactions: List of transactions, each represented as a frozenset of integer items
+    :param int min_support: Minimum support count for an item to be kept
+    :param list[int] weights: Optional number of occurrences of each transaction (see `compress_transactions`)
+    :return rows (list[frozenset]): Transactions made of the ranks of their frequent items, in the same order
+    :return rank_items (list[int]): Original item of each rank
+    """
+    item_counts = get_count_items(transactions, weights)
+    rank_items = sorted((item for item, count in item_counts.items() if count >= min_support),
+                        key=lambda item: (item_counts[item], item))
+    item_ranks = {item: rank for rank, item in enumerate(rank_items)}
+    rows = [frozenset(item_ranks[item] for item in transaction if item in item_ranks) for transaction in transactions]
+    return rows, rank_items
+
+
+def restore_items(itemsets, rank_items):
+    """
+    Maps the itemsets mined on the ranks of `remap_items` back to the original items.
+
+    :param iterable itemsets: Iterable of tuples, each containing a frequent itemset of ranks and its support value
+    :param list[int] rank_items: Original item of each rank
+    :return frequent_itemsets (generator): Frequent itemsets of original items, sorted, along with their frequencies
+    """
+    for itemset, support in itemsets:
+        yield (sorted(rank_items[rank] for rank in itemset), support)
+
+
 def extract_dataset_name(filepath):
     """
     Extracts the dataset name from a given file path.
@@ -138,191 +522,2254 @@ def extract_dataset_name(filepath):
     return filepath.split("/")[1]
 
 
-def manage_output(itemsets, variant_name, dataset_name, minFrequency, is_inginious, is_test):
+def format_itemset(itemset, support):
+    """
+    Formats a frequent itemset and its support as an output line, without the trailing newline.
+
+    :param list itemset: Sorted items of the itemset
+    :param float support: Support (frequency) of the itemset
+    :return line (str): The itemset in the `[<item 1>, ... <item k>] (<frequency>)` format
+    """
+    return f"{itemset} ({'1.0' if support == 1 else f'{support:.17g}'})"
+
+
+def add_phase_time(phase, start_time):
+    """
+    Adds the time elapsed since `start_time` to the time of `phase` in `PHASE_TIMES`, when it is set. The phases are
+    "parse" (reading the transactions), "output" (sorting and writing the itemsets) and "generation" (mining the
+    itemsets that are generated lazily while they are output, which is not part of the output time).
+
+    :param str phase: Name of the phase
+    :param float start_time: Value of `time.perf_counter()` when the phase started
+    """
+    if PHASE_TIMES is not None:
+        PHASE_TIMES[phase] = PHASE_TIMES.get(phase, 0) + time.perf_counter() - start_time
+
+
+def iter_timed(itemsets, phase):
+    """
+    Yields the itemsets of an iterable, adding the time spent producing each of them to `phase` (see `add_phase_time`).
+
+    :param iterable itemsets: Iterable of itemsets
+    :param str phase: Name of the phase
+    :return itemsets (generator): The same itemsets
+    """
+    iterator = iter(itemsets)
+    while True:
+        start_time = time.perf_counter()
+        try:
+            itemset = next(iterator)
+        except StopIteration:
+            add_phase_time(phase, start_time)
+            return
+        add_phase_time(phase, start_time)
+        yield itemset
+
+
+def manage_output(itemsets, variant_name, dataset_name, minFrequency, is_inginious, is_test, sort=None):
     """
     Manages the output of a variant of the Apriori algorithm by either printing results or saving them to a file.
 
-    This function sorts the frequent itemsets, then:
+    The frequent itemsets are consumed one at a time, as the miners produce them, and written through a buffer, so
+    that the whole result never needs to be held in memory. Then:
     - If `is_inginious` is True, it prints the results to the terminal.
     - If `is_test` is False, it saves the results to a file in the "solutions/variant_name" directory.
+    - Otherwise, the itemsets are only consumed, so that the mining still runs to completion.
 
-    :param set itemsets: List of tuples, each containing a frequent itemset and its support value
+    :param iterable itemsets: Iterable of tuples, each containing a frequent itemset and its support value
     :param str variant_name: Name of the Apriori algorithm's variant
     :param str dataset_name: Name of the dataset for file saving
     :param int minFrequency: Minimum frequency threshold used to generate frequent itemsets
     :param boolean is_inginious: Flag indicating whether to print output (True) or not (False)
     :param boolean is_test: Flag indicating whether to save output to a file (False) or not (True)
+    :param boolean sort: Flag indicating whether the itemsets are sorted before being output, which requires holding
+        all of them in memory (default: `SORT_OUTPUT`)
     """
-    itemsets.sort(key=lambda x: (x[0]))
+    if sort is None:
+        sort = SORT_OUTPUT
+    if PHASE_TIMES is not None:
+        start_time = time.perf_counter()
+        generation_time = PHASE_TIMES.get("generation", 0)
+        itemsets = iter_timed(itemsets, "generation")
+    if sort:
+        itemsets = sorted(itemsets, key=lambda x: (x[0]))
 
     if is_inginious:
+        import sys
+        buffer = []
         for itemset, support in itemsets:
-            print(f"{itemset} ({'1.0' if support == 1 else f'{support:.17g}'})")
+            buffer.append(format_itemset(itemset, support))
+            if len(buffer) >= OUTPUT_BUFFER_LINES:
+                buffer.append("")
+                sys.stdout.write("\n".join(buffer))
+                buffer = []
+        if buffer:
+            buffer.append("")
+            sys.stdout.write("\n".join(buffer))
+    elif not is_test:
+        import os
+        output_dir = f"solutions/{variant_name}"
+        os.makedirs(output_dir, exist_ok=True)
+
+        with open(os.path.join(output_dir, f"{dataset_name}_{minFrequency}"), "w", buffering=OUTPUT_BUFFER_BYTES) as f:
+            for itemset, support in itemsets:
+                f.write(format_itemset(itemset, support) + "\n")
     else:
-        if not is_test:
-            import os
-            output_dir = f"solutions/{variant_name}"
-            os.makedirs(output_dir, exist_ok=True)
+        for _ in itemsets:
+            pass
 
-            with open(os.path.join(output_dir, f"{dataset_name}_{minFrequency}"), "w") as f:
-                for itemset, support in itemsets:
-                    f.write(f"{itemset} ({'1.0' if support == 1 else f'{support:.17g}'})\n")
+    if PHASE_TIMES is not None:
+        add_phase_time("output", start_time + PHASE_TIMES["generation"] - generation_time)
 
 
-def apriori_pruning(filepath, minFrequency, is_inginious=False, is_test=True):
+def get_dataset_hash(filepath, appended_filepath=None):
     """
-    Runs the apriori algorithm variant with pruning, on the specified file with the given minimum frequency.
+    Hashes the content of a dataset file, so that the results mined from it can be found again whatever its path.
 
     :param filepath: Path to the transaction dataset file
-    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
-    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: True)
-    :param boolean is_test: Flag indicating whether this run is a test or not (default: False)
+    :param appended_filepath: Optional path to a file of transactions appended to the dataset, hashed as if it was
+        already at the end of the dataset file
+    :return dataset_hash (str): Hexadecimal SHA-256 digest of the file
     """
-    transactions, num_transactions = read_transactions(filepath)
-    min_support = minFrequency * num_transactions
+    import hashlib
+
+    digest = hashlib.sha256()
+    for path in (filepath, appended_filepath):
+        if path is not None:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(OUTPUT_BUFFER_BYTES), b""):
+                    digest.update(chunk)
+    return digest.hexdigest()
 
-    F_i = {frozenset([item]) for item, count in get_count_items(transactions).items() if count >= min_support}
-
-    all_frequent_itemsets = []
-    i = 1
-    while F_i:
-        for itemset in F_i:
-            support = sum(1 for transaction in transactions if itemset.issubset(transaction)) / num_transactions
-            all_frequent_itemsets.append((sorted(map(int, itemset)), support))
-
-        C_i = set()
-        F_i_list = list(F_i)
-        for j in range(len(F_i_list)):
-            for k in range(j + 1, len(F_i_list)):
-                candidate = F_i_list[j] | F_i_list[k]
-                if len(candidate) == i + 1:
-                    if all(frozenset(subset) in F_i for subset in itertools.combinations(candidate, i)):
-                        C_i.add(candidate)
-
-        candidate_counts = {c: 0 for c in C_i}
-        for transaction in transactions:
-            for candidate in C_i:
-                if candidate.issubset(transaction):
-                    candidate_counts[candidate] += 1
 
-        F_i = {itemset for itemset, count in candidate_counts.items() if count >= min_support}
-        i += 1
-    manage_output(all_frequent_itemsets, "apriori_pruning", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+def get_store_slot(node, item, index_bits):
+    """
+    Returns the slot of the hash index of an itemset store (see `write_itemset_store`) at which the child of a node
+    holding an item is searched first, by Fibonacci hashing of the pair.
+
+    :param int node: Node of the trie
+    :param int item: Item of the child
+    :param int index_bits: Base 2 logarithm of the number of slots of the index
+    :return slot (int): Slot of the index
+    """
+    return (((node << 32) | (item & 0xFFFFFFFF)) * 0x9E3779B97F4A7C15 & 0xFFFFFFFFFFFFFFFF) >> (64 - index_bits)
 
 
-def apriori_no_pruning(filepath, minFrequency, is_inginious=False, is_test=True):
+def write_itemset_store(store_path, itemsets, num_transactions, min_support):
     """
-    Runs the apriori algorithm variant without pruning, on the specified file with the given minimum frequency, without pruning.
+    Writes frequent itemsets to a store file, as a trie flattened in breadth-first order.
+
+    The file holds a header (magic, number of transactions, minimum support, number of nodes and base 2 logarithm of
+    the size of the index), followed by three arrays indexed by node, the root being node 0: the int64 offsets of the
+    children of each node, which are contiguous and sorted by item (with one more offset at the end), the int64
+    supports of the nodes, and their int32 items. Then comes the index, an open-addressing hash table of int64 nodes,
+    at least twice as large as the number of nodes, in which each node other than the root is found from its parent and
+    its item, from the slot given by `get_store_slot` onwards (0 marking an empty slot).
+
+    :param str store_path: Path of the store file
+    :param iterable itemsets: Iterable of tuples, each containing a frequent itemset and its support value. Every
+        prefix of an itemset must be one of the itemsets, as with all the frequent itemsets above a minimum support.
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param float min_support: Minimum support count with which the itemsets were mined
+    """
+    import array
+    import os
+    import struct
+
+    supports = {tuple(sorted(itemset)): round(frequency * num_transactions) for itemset, frequency in itemsets}
+    nodes = sorted(supports, key=lambda x: (len(x), x))
+    node_ids = {itemset: node for node, itemset in enumerate(nodes, 1)}
+    node_ids[()] = 0
+
+    num_children = [0] * (len(nodes) + 1)
+    for itemset in nodes:
+        parent = node_ids.get(itemset[:-1])
+        if parent is None:
+            raise ValueError(f"The prefix of {list(itemset)} is missing from the itemsets")
+        num_children[parent] += 1
+    offsets = array.array("q", [1])
+    for count in num_children:
+        offsets.append(offsets[-1] + count)
+
+    index_bits = max(1, (2 * len(nodes)).bit_length())
+    index_mask = (1 << index_bits) - 1
+    index = array.array("q", bytes(8 << index_bits))
+    for node, itemset in enumerate(nodes, 1):
+        slot = get_store_slot(node_ids[itemset[:-1]], itemset[-1], index_bits)
+        while index[slot]:
+            slot = (slot + 1) & index_mask
+        index[slot] = node
+
+    os.makedirs(os.path.dirname(store_path) or ".", exist_ok=True)
+    temporary_path = f"{store_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(struct.pack(RESULT_STORE_HEADER, RESULT_STORE_MAGIC, num_transactions, min_support, len(nodes) + 1,
+                            index_bits))
+        f.write(memoryview(offsets).cast("B"))
+        f.write(memoryview(array.array("q", [num_transactions] + [supports[itemset] for itemset in nodes])).cast("B"))
+        f.write(memoryview(array.array("i", [-1] + [itemset[-1] for itemset in nodes])).cast("B"))
+        f.write(memoryview(index).cast("B"))
+    os.replace(temporary_path, store_path)
+
+
+class ItemsetStore:
+    """Utility class to query the frequent itemsets of a store file (see `write_itemset_store`), memory-mapped."""
+
+    def __init__(self, store_path):
+        """maps the store file and checks its header"""
+        import mmap
+        import struct
+
+        with open(store_path, "rb") as f:
+            store = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header_size = struct.calcsize(RESULT_STORE_HEADER)
+        if len(store) < header_size:
+            raise ValueError(f"'{store_path}' is not an itemset store")
+        magic, self.num_transactions, self.min_support, num_nodes, self.index_bits = struct.unpack_from(
+            RESULT_STORE_HEADER, store)
+        supports_start = header_size + 8 * (num_nodes + 1)
+        items_start = supports_start + 8 * num_nodes
+        index_start = items_start + 4 * num_nodes
+        if (magic != RESULT_STORE_MAGIC or not 0 < self.index_bits < 64 or
+                len(store) != index_start + (8 << self.index_bits)):
+            raise ValueError(f"'{store_path}' is not an itemset store")
+
+        buffer = memoryview(store)
+        self.offsets = buffer[header_size:supports_start].cast("q")
+        self.supports = buffer[supports_start:items_start].cast("q")
+        self.items = buffer[items_start:index_start].cast("i")
+        self.index = buffer[index_start:].cast("q")
+
+    def __len__(self):
+        """Returns the number of itemsets in the store"""
+        return len(self.items) - 1
+
+    def find(self, itemset):
+        """
+        Returns the node of `itemset` in the trie, or None if it is not stored. The child holding each item is looked up
+        in the hash index in constant expected time, so that finding an itemset takes O(len(itemset)) when its items are
+        given in order (as they are output), and O(len(itemset) log(len(itemset))) to sort them otherwise.
+        """
+        index_mask = (1 << self.index_bits) - 1
+        node = 0
+        for item in sorted(itemset):
+            slot = get_store_slot(node, item, self.index_bits)
+            while True:
+                child = self.index[slot]
+                if child == 0:
+                    return None
+                if self.items[child] == item and self.offsets[node] <= child < self.offsets[node + 1]:
+                    break
+                slot = (slot + 1) & index_mask
+            node = child
+        return node
+
+    def support(self, itemset):
+        """Returns the support count of `itemset`, or None if it is below the minimum support of the store"""
+        node = self.find(itemset)
+        return None if node is None else self.supports[node]
+
+    def itemsets(self, min_support=0):
+        """Yields the stored itemsets whose support reaches `min_support`, along with their frequencies"""
+        stack = [(0, [])]
+        while stack:
+            node, itemset = stack.pop()
+            for child in range(self.offsets[node], self.offsets[node + 1]):
+                support = self.supports[child]
+                if support >= min_support:
+                    child_itemset = itemset + [self.items[child]]
+                    yield (child_itemset, support / self.num_transactions)
+                    stack.append((child, child_itemset))
+
+
+def find_itemset_store(filepath, minFrequency):
+    """
+    Finds the store of the itemsets of a dataset mined with the highest minimum frequency up to `minFrequency`, among
+    the stores of `RESULT_STORE_DIR`, named after the hash of the content of the dataset and the minimum frequency.
 
     :param filepath: Path to the transaction dataset file
-    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
-    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: True)
-    :param boolean is_test: Flag indicating whether this run is a test or not (default: False)
+    :param float minFrequency: Minimum frequency threshold of the itemsets to be found
+    :return store (ItemsetStore): Store holding all the frequent itemsets of the dataset for `minFrequency`, or None
+    """
+    import os
+
+    prefix = f"{get_dataset_hash(filepath)}_"
+    best_frequency = None
+    try:
+        names = os.listdir(RESULT_STORE_DIR)
+    except OSError:
+        return None
+    for name in names:
+        if name.startswith(prefix) and not name.endswith(".tmp"):
+            try:
+                frequency = float(name[len(prefix):])
+            except ValueError:
+                continue
+            if frequency <= minFrequency and (best_frequency is None or frequency > best_frequency):
+                best_frequency = frequency
+    if best_frequency is None:
+        return None
+    try:
+        return ItemsetStore(os.path.join(RESULT_STORE_DIR, f"{prefix}{best_frequency}"))
+    except (OSError, ValueError):
+        return None
+
+
+def create_itemset_store(filepath, minFrequency, algorithm="eclat"):
+    """
+    Mines the frequent itemsets of the specified file with the given variant and minimum frequency, and stores them
+    in `RESULT_STORE_DIR` (see `find_itemset_store`).
+
+    :param filepath: Path to the transaction dataset file
+    :param float minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param str algorithm: Name of the variant (see `mine_itemsets`)
+    :return store (ItemsetStore): Store holding the frequent itemsets
     """
+    import os
+
     transactions, num_transactions = read_transactions(filepath)
     min_support = minFrequency * num_transactions
+    all_frequent_itemsets = mine_itemsets(transactions, num_transactions, min_support, algorithm)
+    store_path = os.path.join(RESULT_STORE_DIR, f"{get_dataset_hash(filepath)}_{minFrequency}")
+    write_itemset_store(store_path, all_frequent_itemsets, num_transactions, min_support)
+    return ItemsetStore(store_path)
 
-    F_i = {frozenset([item]) for item, count in get_count_items(transactions).items() if count >= min_support}
-
-    all_frequent_itemsets = []
-    i = 1
-    while F_i:
-        for itemset in F_i:
-            support = sum(1 for transaction in transactions if itemset.issubset(transaction)) / num_transactions
-            all_frequent_itemsets.append((sorted(map(int, itemset)), support))
-
-        C_i = set()
-        F_i_list = list(F_i)
-        for j in range(len(F_i_list)):
-            for k in range(j + 1, len(F_i_list)):
-                candidate = F_i_list[j] | F_i_list[k]
-                if len(candidate) == i + 1:
-                    C_i.add(candidate)
 
-        candidate_counts = {c: 0 for c in C_i}
-        for transaction in transactions:
-            for candidate in C_i:
-                if candidate.issubset(transaction):
-                    candidate_counts[candidate] += 1
+def mine_stored(filepath, minFrequency, is_inginious=False, is_test=False, algorithm="eclat"):
+    """
+    Outputs the frequent itemsets of the specified file with the given minimum frequency from the store of a previous
+    run at the same or a lower minimum frequency (see `find_itemset_store`). If there is none, the itemsets are mined
+    with the given variant and stored for the next runs.
 
-        F_i = {itemset for itemset, count in candidate_counts.items() if count >= min_support}
-        i += 1
-    manage_output(all_frequent_itemsets, "apriori_no_pruning", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+    :param filepath: Path to the transaction dataset file
+    :param float minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :param str algorithm: Name of the variant (see `mine_itemsets`), under which the results are output
+    :return store (ItemsetStore): Store from which the itemsets were output, which can also be queried
+    """
+    store = find_itemset_store(filepath, minFrequency)
+    if store is None:
+        store = create_itemset_store(filepath, minFrequency, algorithm)
 
+    all_frequent_itemsets = store.itemsets(minFrequency * store.num_transactions)
+    manage_output(all_frequent_itemsets, algorithm, extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+    return store
 
-def eclat_search(prefix_tids, items, vertical_db, min_support, num_transactions, prefix=[]):
-    """
-    Recursive DFS/ECLAT function to find frequent itemsets.
-    
-    :param list[int] prefix_tids: Set of TIDs (transaction IDs) containing the current prefix
-    :param list items: List of candidate items to extend the current prefix
-    :param dict vertical_db: Vertical database mapping items to sets of TIDs
-    :param int min_support: Minimum support count required to consider itemset frequent
-    :param int num_transactions: Total number of transactions (used for frequency calculation)
-    :param list[items] prefix: Current prefix itemset
-    :return frequent_itemsets (list): List of frequent itemsets found along with their frequencies
+
+def build_hash_tree(candidates, size):
     """
-    all_frequent_itemsets = []
+    Stores candidate itemsets of the same size in a hash tree keyed by their items in increasing order.
 
-    for i in range(len(items)):
-        item = items[i]
-        new_tids = prefix_tids & vertical_db[item]
+    Interior nodes are dictionaries mapping the item at their depth to a child node. Leaves are lists of
+    (candidate, frozenset of its items) pairs, split into an interior node once they hold more than `HASH_TREE_LEAF_SIZE`
+    candidates, so that a transaction only reaches the leaves whose path it contains.
 
-        if len(new_tids) >= min_support:
-            new_prefix = prefix + [int(item)]
-            frequency = len(new_tids) / num_transactions
-            all_frequent_itemsets.append((sorted(new_prefix), frequency))
+    :param set[tuple] candidates: Candidate itemsets, all of the same size, each represented as a sorted tuple of items
+    :param int size: Size of the candidate itemsets
+    :return hash_tree (dict | list): Root node of the hash tree
+    """
+    def insert(node, candidate, depth):
+        if isinstance(node, dict):
+            node[candidate[depth]] = insert(node.get(candidate[depth], []), candidate, depth + 1)
+            return node
+        node.append((candidate, frozenset(candidate)))
+        if len(node) <= HASH_TREE_LEAF_SIZE or depth == size:
+            return node
+        interior = {}
+        for leaf_candidate, _ in node:
+            interior[leaf_candidate[depth]] = insert(interior.get(leaf_candidate[depth], []), leaf_candidate, depth + 1)
+        return interior
 
-            new_items = items[i+1:]
-            new_vertical_db = {}
+    hash_tree = []
+    for candidate in candidates:
+        hash_tree = insert(hash_tree, candidate, 0)
+    return hash_tree
 
-            for next_item in new_items:
-                intersected = vertical_db[next_item] & new_tids
-                if len(intersected) >= min_support:
-                    new_vertical_db[next_item] = intersected
 
-            deeper_frequent_itemsets = eclat_search(new_tids, list(new_vertical_db.keys()), new_vertical_db,
-                                             min_support, num_transactions, prefix=new_prefix)
-            all_frequent_itemsets.extend(deeper_frequent_itemsets)
-    return all_frequent_itemsets
+def count_hash_tree(node, items, transaction, start, depth, size, candidate_counts, weight=1):
+    """
+    Increments the counts of the candidates of a hash (sub)tree contained in a transaction.
 
+    :param dict | list node: Current node of the hash tree
+    :param list items: Sorted items of the transaction
+    :param frozenset transaction: Items of the transaction
+    :param int start: Index of the first item of the transaction that can extend the path to the current node
+    :param int depth: Depth of the current node, i.e. number of items on the path from the root
+    :param int size: Size of the candidate itemsets
+    :param dict candidate_counts: Dictionary mapping each candidate to its count, updated in place
+    :param int weight: Number of occurrences of the transaction (default: 1)
+    """
+    if isinstance(node, list):
+        for candidate, candidate_items in node:
+            if candidate_items <= transaction:
+                candidate_counts[candidate] += weight
+    else:
+        for i in range(start, len(items) - size + depth + 1):
+            child = node.get(items[i])
+            if child is not None:
+                count_hash_tree(child, items, transaction, i + 1, depth + 1, size, candidate_counts, weight)
 
-def create_vertical_db(transactions):
+
+def count_candidates(candidates, transactions, counting="hash_tree", weights=None):
     """
-    Builds a vertical database from a list of transactions.
+    Counts the number of transactions containing each candidate itemset.
 
+    :param set[tuple] candidates: Candidate itemsets, all of the same size, each represented as a sorted tuple of items
     :param list[frozenset] transactions: List of transactions, each represented as a frozenset of integer items
-    :return vertical_db (dict): Vertical database mapping items to sets of TIDs (transaction IDs)
+    :param str counting: Counting method, either "hash_tree" (see `build_hash_tree`) or "naive" (subset test of every
+        candidate against every transaction, kept as a reference)
+    :param list[int] weights: Optional number of occurrences of each transaction (see `compress_transactions`)
+    :return candidate_counts (dict): Dictionary mapping each candidate to its count
     """
-    vertical_db = {}
-    for tid, transaction in enumerate(transactions):
-        for item in transaction:
-            if item not in vertical_db:
-                vertical_db[item] = set()
-            vertical_db[item].add(tid)
-    return vertical_db
+    candidate_counts = {c: 0 for c in candidates}
+    if not candidates:
+        return candidate_counts
+    if weights is None:
+        weights = itertools.repeat(1)
+
+    if counting == "naive":
+        candidate_sets = [(candidate, frozenset(candidate)) for candidate in candidates]
+        for transaction, weight in zip(transactions, weights):
+            for candidate, candidate_items in candidate_sets:
+                if candidate_items.issubset(transaction):
+                    candidate_counts[candidate] += weight
+    elif counting == "hash_tree":
+        size = len(next(iter(candidates)))
+        hash_tree = build_hash_tree(candidates, size)
+        candidate_items = frozenset(itertools.chain.from_iterable(candidates))
+        for transaction, weight in zip(transactions, weights):
+            transaction = transaction & candidate_items
+            if len(transaction) >= size:
+                count_hash_tree(hash_tree, sorted(transaction), transaction, 0, 0, size, candidate_counts, weight)
+    else:
+        raise ValueError(f"Unknown counting method '{counting}'")
+    return candidate_counts
 
 
-def eclat(filepath, minFrequency, is_inginious=False, is_test=False):
+def build_transaction_bitmap(transactions, items):
     """
-    Runs the ECLAT frequent itemset mining algorithm on the specified file with the given minimum frequency.
-    
-    :param filepath: Path to the transaction dataset file
-    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
-    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
-    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    Builds a packed bitmap of the transactions: one row per item, whose bit `tid` is set when the transaction `tid`
+    contains the item.
+
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of integer
+        items, or their CSR layout (see `read_transactions`)
+    :param iterable items: Items to store in the bitmap
+    :return item_rows (dict): Dictionary mapping each item to its row in the bitmap
+    :return bitmap (numpy.ndarray): Array of shape (number of items, number of 64-bit words) of dtype uint64
     """
-    transactions, num_transactions = read_transactions(filepath)
-    min_support = minFrequency * num_transactions
+    import numpy as np
+
+    item_rows = {item: row for row, item in enumerate(sorted(items))}
+    if is_csr(transactions):
+        offsets, transaction_items = transactions
+        num_transactions = len(offsets) - 1
+        lookup = np.full(max(item_rows, default=-1) + 1, -1, dtype=np.int64)
+        lookup[list(item_rows.keys())] = list(item_rows.values())
+        tids = np.repeat(np.arange(num_transactions, dtype=np.int64), np.diff(offsets))
+        is_kept = transaction_items < len(lookup)
+        rows, tids = lookup[transaction_items[is_kept]], tids[is_kept]
+        is_kept = rows >= 0
+        rows, tids = rows[is_kept], tids[is_kept]
+    else:
+        num_transactions = len(transactions)
+        rows, tids = [], []
+        for tid, transaction in enumerate(transactions):
+            for item in transaction:
+                row = item_rows.get(item)
+                if row is not None:
+                    rows.append(row)
+                    tids.append(tid)
+
+    num_words = (num_transactions + 63) // 64
+    bitmap = np.zeros((len(item_rows), num_words * 8), dtype=np.uint8)
+    tids = np.asarray(tids, dtype=np.int64)
+    np.bitwise_or.at(bitmap, (np.asarray(rows, dtype=np.int64), tids >> 3), (1 << (tids & 7)).astype(np.uint8))
+    return item_rows, bitmap.view(np.uint64)
+
+
+def count_candidates_bitmap(candidates, item_rows, bitmap):
+    """
+    Counts the number of transactions containing each candidate itemset, by AND-reducing the bitmap rows of its items
+    and counting the bits left, for batches of candidates at once.
+
+    :param set[tuple] candidates: Candidate itemsets, all of the same size, each represented as a sorted tuple of items
+    :param dict item_rows: Dictionary mapping each item to its row in the bitmap (see `build_transaction_bitmap`)
+    :param numpy.ndarray bitmap: Packed bitmap of the transactions (see `build_transaction_bitmap`)
+    :return candidate_counts (dict): Dictionary mapping each candidate to its count
+    """
+    import numpy as np
+
+    candidates = list(candidates)
+    if not candidates:
+        return {}
+
+    rows = np.array([[item_rows[item] for item in candidate] for candidate in candidates], dtype=np.int64)
+    batch_size = max(1, BITMAP_BATCH_BYTES // bitmap[0].nbytes)
+    counts = np.empty(len(candidates), dtype=np.int64)
+    for start in range(0, len(candidates), batch_size):
+        batch = rows[start:start + batch_size]
+        intersection = bitmap[batch[:, 0]]
+        for column in range(1, batch.shape[1]):
+            intersection &= bitmap[batch[:, column]]
+        counts[start:start + batch_size] = popcount(intersection).sum(axis=1)
+    return dict(zip(candidates, counts.tolist()))
+
+
+def popcount(words):
+    """
+    Counts the bits set in each 64-bit word of an array.
+
+    :param numpy.ndarray words: Array of dtype uint64
+    :return counts (numpy.ndarray): Array of the same shape holding the number of bits set in each word
+    """
+    import numpy as np
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    byte_counts = np.unpackbits(words.view(np.uint8)).reshape(*words.shape, 64)
+    return byte_counts.sum(axis=-1)
+
+
+def generate_candidates(F_i, prune=True, level_stats=None):
+    """
+    Generates the candidates of the next Apriori level by joining the frequent itemsets sharing the same prefix.
+
+    The frequent itemsets are grouped by their first k-1 items, and only two itemsets of the same group are joined, so
+    that every candidate of size k+1 is generated exactly once.
+
+    :param set[tuple] | dict F_i: Frequent itemsets of size k, each represented as a sorted tuple of items
+    :param boolean prune: Flag indicating whether candidates with an infrequent subset of size k are discarded
+    :param dict level_stats: Optional dictionary filled with the number of candidates joined ("generated") and of
+        candidates discarded by the subset check ("pruned")
+    :return C_i (set[tuple]): Candidate itemsets of size k+1, each represented as a sorted tuple of items
+    """
+    prefix_groups = {}
+    for itemset in F_i:
+        prefix_groups.setdefault(itemset[:-1], []).append(itemset[-1])
+
+    C_i = set()
+    for prefix, last_items in prefix_groups.items():
+        last_items.sort()
+        for j in range(len(last_items)):
+            for k in range(j + 1, len(last_items)):
+                candidate = prefix + (last_items[j], last_items[k])
+                # The subsets dropping one of the two last items are the joined itemsets themselves
+                if not prune or all(candidate[:m] + candidate[m+1:] in F_i for m in range(len(prefix))):
+                    C_i.add(candidate)
+    if level_stats is not None:
+        level_stats["generated"] = sum(len(last_items) * (len(last_items) - 1) // 2
+                                       for last_items in prefix_groups.values())
+        level_stats["pruned"] = level_stats["generated"] - len(C_i)
+    return C_i
+
+
+def counting_worker(connection, transactions, counting, weights=None):
+    """
+    Counts the candidates received on a connection over a partition of the transactions, until None is received.
+    The partition is received once, when the worker is started, and stays in the worker for every level.
+
+    :param multiprocessing.connection.Connection connection: Connection to the main process
+    :param list[frozenset] transactions: Partition of the transactions counted by this worker
+    :param str counting: Candidate counting method, either "hash_tree" or "naive" (see `count_candidates`)
+    :param list[int] weights: Optional number of occurrences of each transaction of the partition
+    """
+    while True:
+        candidates = connection.recv()
+        if candidates is None:
+            break
+        candidate_counts = count_candidates(candidates, transactions, counting, weights)
+        connection.send([candidate_counts[candidate] for candidate in candidates])
+    connection.close()
+
+
+def get_level_stats(level, generated, pruned, counted, kept, start_time):
+    """
+    Returns the statistics of a level of the Apriori search, as stored in the "levels" list of its `stats`.
+
+    :param int level: Size of the candidates of the level
+    :param int generated: Number of candidates joined from the frequent itemsets of the previous level
+    :param int pruned: Number of candidates discarded because one of their subsets is not frequent
+    :param int counted: Number of candidates whose support is counted on the transactions
+    :param int kept: Number of candidates that are frequent
+    :param float start_time: Value of `time.perf_counter()` when the level started
+    :return level_stats (dict): The statistics, with the time spent on the level, in seconds, under the "time" key
+    """
+    return {"level": level, "generated": generated, "pruned": pruned, "counted": counted, "kept": kept,
+            "time": time.perf_counter() - start_time}
+
+
+def apriori_search(transactions, min_support, num_transactions, prune=True, counting="hash_tree", stats=None,
+                   workers=None, weights=None):
+    """
+    Level-wise Apriori search of the frequent itemsets of a list of transactions.
+
+    Each level is a dictionary mapping its frequent itemsets to their support count, so that a level only costs one
+    pass over the transactions: the counts of the candidates are kept as the supports of the next level.
+
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of integer
+        items, or, with "bitmap" counting, their CSR layout (see `read_transactions`)
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param boolean prune: Flag indicating whether candidates with an infrequent subset are discarded before counting
+    :param str counting: Candidate counting method, either "hash_tree" or "naive" (see `count_candidates`), or
+        "bitmap" (see `count_candidates_bitmap`)
+    :param dict stats: Optional dictionary in which the number of passes over the transactions of each level is
+        stored, as a list under the "scans" key, the number of candidates counted under the "nodes" key, and the
+        statistics of each level under the "levels" key (see `get_level_stats`)
+    :param int workers: Number of worker processes over which the transactions are partitioned for counting the
+        candidates, at least 1, or None to count them in the current process (default: None)
+    :param list[int] weights: Optional number of occurrences of each transaction (see `compress_transactions`)
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    if workers is not None and workers < 1:
+        raise ValueError(f"Invalid number of worker processes {workers}, which must be at least 1")
+    if counting == "bitmap":
+        if workers is not None:
+            raise ValueError("The bitmap counting method cannot be combined with worker processes")
+        if weights is not None:
+            raise ValueError("The bitmap counting method cannot be combined with weighted transactions")
+
+    start_time = time.perf_counter()
+    item_counts = get_count_items(transactions, weights)
+    scans = 1
+    F_i = {(item,): count for item, count in item_counts.items() if count >= min_support}
+    if counting == "bitmap":
+        item_rows, bitmap = build_transaction_bitmap(transactions, (itemset[0] for itemset in F_i))
+        scans += 1
+    if stats is not None:
+        stats["scans"] = [scans]
+        stats["nodes"] = 0
+        stats["levels"] = [get_level_stats(1, len(item_counts), 0, len(item_counts), len(F_i), start_time)]
 
-    vertical_db = create_vertical_db(transactions)
+    connections = []
+    processes = []
+    if workers is not None:
+        import multiprocessing
 
-    all_items = sorted(vertical_db.keys(), key=lambda x: int(x))
+        partition_size = (len(transactions) + workers - 1) // workers
+        for w in range(workers):
+            connection, worker_connection = multiprocessing.Pipe()
+            partition = slice(w * partition_size, (w + 1) * partition_size)
+            partition_weights = weights[partition] if weights is not None else None
+            process = multiprocessing.Process(target=counting_worker,
+                                              args=(worker_connection, transactions[partition], counting, partition_weights))
+            process.start()
+            worker_connection.close()
+            connections.append(connection)
+            processes.append(process)
+
+    try:
+        while F_i:
+            for itemset, count in F_i.items():
+                yield (list(map(int, itemset)), count / num_transactions)
+
+            start_time = time.perf_counter()
+            level_stats = {} if stats is not None else None
+            C_i = generate_candidates(F_i, prune, level_stats)
+            if not C_i:
+                if stats is not None:
+                    stats["levels"].append(get_level_stats(len(next(iter(F_i))) + 1, level_stats["generated"],
+                                                           level_stats["pruned"], 0, 0, start_time))
+                break
+
+            # Each round of the workers is one pass over the transactions, split between the partitions
+            scans = 0
+            if connections:
+                C_i = list(C_i)
+                for connection in connections:
+                    connection.send(C_i)
+                counts = [0] * len(C_i)
+                for connection in connections:
+                    counts = [total + count for total, count in zip(counts, connection.recv())]
+                candidate_counts = dict(zip(C_i, counts))
+                scans += 1
+            elif counting == "bitmap":
+                candidate_counts = count_candidates_bitmap(C_i, item_rows, bitmap)
+                scans += 1
+            else:
+                candidate_counts = count_candidates(C_i, transactions, counting, weights)
+                scans += 1
+            F_i = {itemset: count for itemset, count in candidate_counts.items() if count >= min_support}
+            if stats is not None:
+                stats["scans"].append(scans)
+                stats["nodes"] += len(candidate_counts)
+                stats["levels"].append(get_level_stats(len(next(iter(C_i))), level_stats["generated"],
+                                                       level_stats["pruned"], len(C_i), len(F_i), start_time))
+    finally:
+        for connection in connections:
+            connection.send(None)
+            connection.close()
+        for process in processes:
+            process.join()
+
+
+def apriori_pruning(filepath, minFrequency, is_inginious=False, is_test=True, counting="hash_tree", stats=None,
+                    workers=None, dedup=False, reorder=False):
+    """
+    Runs the apriori algorithm variant with pruning, on the specified file with the given minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: True)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: False)
+    :param str counting: Candidate counting method, either "hash_tree", "naive" or "bitmap" (see `apriori_search`)
+    :param dict stats: Optional dictionary filled with the number of passes over the transactions of each level and
+        the number of itemsets counted (see `apriori_search`)
+    :param int workers: Number of worker processes counting the candidates over partitions of the transactions, or
+        None to count them in the current process (default: None)
+    :param boolean dedup: Flag indicating whether the transactions are mined as weighted rows, once their infrequent
+        items are removed and the identical ones merged (see `compress_transactions`) (default: False)
+    :param boolean reorder: Flag indicating whether the items are renamed to ranks of ascending support before mining
+        (see `remap_items`) (default: False)
+    """
+    transactions, num_transactions = read_transactions(filepath, csr=counting == "bitmap" and not dedup and not reorder)
+    min_support = minFrequency * num_transactions
+
+    weights = None
+    if dedup:
+        transactions, weights = compress_transactions(transactions, min_support)
+    if reorder:
+        transactions, rank_items = remap_items(transactions, min_support, weights)
+    all_frequent_itemsets = apriori_search(transactions, min_support, num_transactions, True, counting, stats, workers,
+                                           weights)
+    if reorder:
+        all_frequent_itemsets = restore_items(all_frequent_itemsets, rank_items)
+    variant_name = "apriori_bitmap" if counting == "bitmap" else "apriori_pruning"
+    manage_output(all_frequent_itemsets, variant_name, extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+
+
+def apriori_bitmap(filepath, minFrequency, is_inginious=False, is_test=True):
+    """
+    Runs the apriori algorithm variant with pruning, counting the candidates on a packed NumPy bitmap of the
+    transactions, on the specified file with the given minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: True)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: False)
+    """
+    apriori_pruning(filepath, minFrequency, is_inginious, is_test, counting="bitmap")
+
+
+def apriori_no_pruning(filepath, minFrequency, is_inginious=False, is_test=True, counting="hash_tree", stats=None,
+                       dedup=False, reorder=False):
+    """
+    Runs the apriori algorithm variant without pruning, on the specified file with the given minimum frequency, without pruning.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: True)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: False)
+    :param str counting: Candidate counting method, either "hash_tree" or "naive" (see `count_candidates`)
+    :param dict stats: Optional dictionary filled with the number of passes over the transactions of each level and
+        the number of itemsets counted (see `apriori_search`)
+    :param boolean dedup: Flag indicating whether the transactions are mined as weighted rows, once their infrequent
+        items are removed and the identical ones merged (see `compress_transactions`) (default: False)
+    :param boolean reorder: Flag indicating whether the items are renamed to ranks of ascending support before mining
+        (see `remap_items`) (default: False)
+    """
+    transactions, num_transactions = read_transactions(filepath)
+    min_support = minFrequency * num_transactions
+
+    weights = None
+    if dedup:
+        transactions, weights = compress_transactions(transactions, min_support)
+    if reorder:
+        transactions, rank_items = remap_items(transactions, min_support, weights)
+    all_frequent_itemsets = apriori_search(transactions, min_support, num_transactions, False, counting, stats,
+                                           weights=weights)
+    if reorder:
+        all_frequent_itemsets = restore_items(all_frequent_itemsets, rank_items)
+    manage_output(all_frequent_itemsets, "apriori_no_pruning", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+
+
+def fup_search(store, filepath, new_transactions, min_support, stats=None):
+    """
+    Level-wise FUP search of the frequent itemsets of a dataset to which transactions were appended, from the
+    itemsets stored for the dataset before the update.
+
+    At each level, the candidates are counted on the new transactions only. The support of a stored candidate is
+    then its stored support plus its new count. A candidate that was not stored had a support below the minimum
+    support of the store, so it is discarded if that bound and its new count cannot reach `min_support`. Only the
+    remaining candidates are counted on the old transactions, which are read the first time this is needed.
+
+    :param ItemsetStore store: Frequent itemsets of the dataset before the update
+    :param filepath: Path to the transaction dataset file, before the update
+    :param list[frozenset] new_transactions: Transactions appended to the dataset
+    :param float min_support: Minimum support count required to consider itemset frequent, in the updated dataset
+    :param dict stats: Optional dictionary in which the number of candidates counted on the old transactions is stored
+        under the "rescanned" key, and the number of passes over the old transactions under the "old_scans" key
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    num_transactions = store.num_transactions + len(new_transactions)
+    old_transactions = None
+    if stats is not None:
+        stats["rescanned"] = 0
+        stats["old_scans"] = 0
+
+    new_counts = get_count_items(new_transactions)
+    candidates = set(new_counts)
+    candidates.update(store.items[node] for node in range(store.offsets[0], store.offsets[1]))
+    candidate_counts = {(item,): new_counts.get(item, 0) for item in candidates}
+
+    while candidate_counts:
+        F_i = {}
+        rescan = []
+        for itemset, count in candidate_counts.items():
+            old_support = store.support(itemset)
+            if old_support is not None:
+                if old_support + count >= min_support:
+                    F_i[itemset] = old_support + count
+            elif store.min_support + count > min_support:
+                rescan.append(itemset)
+
+        if rescan:
+            if old_transactions is None:
+                old_transactions, _ = read_transactions(filepath)
+            if stats is not None:
+                stats["rescanned"] += len(rescan)
+                stats["old_scans"] += 1
+            for itemset, old_support in count_candidates(rescan, old_transactions).items():
+                if old_support + candidate_counts[itemset] >= min_support:
+                    F_i[itemset] = old_support + candidate_counts[itemset]
+
+        for itemset, support in F_i.items():
+            yield (list(itemset), support / num_transactions)
+
+        C_i = generate_candidates(F_i)
+        candidate_counts = count_candidates(C_i, new_transactions)
+
+
+def fup_update(filepath, new_filepath, minFrequency, is_inginious=False, is_test=False, stats=None):
+    """
+    Runs the FUP incremental update on the specified file, to which the transactions of `new_filepath` are appended,
+    with the given minimum frequency (see `fup_search`). The itemsets of the file before the update are taken from its
+    store (see `find_itemset_store`), which is mined first if there is none. The updated itemsets are stored as those
+    of the file once the new transactions are appended to it, and output.
+
+    :param filepath: Path to the transaction dataset file, before the update
+    :param new_filepath: Path to the file of the transactions appended to the dataset
+    :param float minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :param dict stats: Optional dictionary filled with the number of candidates counted on the old transactions and
+        of passes over them (see `fup_search`)
+    :return store (ItemsetStore): Store holding the frequent itemsets of the updated dataset
+    """
+    import os
+
+    store = find_itemset_store(filepath, minFrequency)
+    if store is None:
+        store = create_itemset_store(filepath, minFrequency)
+    new_transactions, num_new_transactions = read_transactions(new_filepath, use_cache=False)
+    num_transactions = store.num_transactions + num_new_transactions
+    min_support = minFrequency * num_transactions
+
+    all_frequent_itemsets = fup_search(store, filepath, new_transactions, min_support, stats)
+    store_path = os.path.join(RESULT_STORE_DIR, f"{get_dataset_hash(filepath, new_filepath)}_{minFrequency}")
+    write_itemset_store(store_path, all_frequent_itemsets, num_transactions, min_support)
+    store = ItemsetStore(store_path)
+
+    all_frequent_itemsets = store.itemsets(min_support)
+    manage_output(all_frequent_itemsets, "fup", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+    return store
+
+
+def add_depth_stats(stats, depth, nodes, intersections, tidset_size):
+    """
+    Accumulates statistics of a depth of an ECLAT search in the "depths" list of its `stats`, whose entry `depth - 1`
+    holds the number of itemsets of `depth` items visited ("nodes"), of intersections computing their tidsets
+    ("intersections") and the total size of these tidsets ("tidset_size"). See `write_stats` for their average size.
+
+    :param dict stats: Dictionary of the statistics of the search
+    :param int depth: Number of items of the itemsets
+    :param int nodes: Number of itemsets visited
+    :param int intersections: Number of intersections computed
+    :param int tidset_size: Total size of the tidsets computed by the intersections
+    """
+    depths = stats.setdefault("depths", [])
+    while len(depths) < depth:
+        depths.append({"depth": len(depths) + 1, "nodes": 0, "intersections": 0, "tidset_size": 0})
+    depth_stats = depths[depth - 1]
+    depth_stats["nodes"] += nodes
+    depth_stats["intersections"] += intersections
+    depth_stats["tidset_size"] += tidset_size
+
+
+def write_stats(stats, filepath):
+    """
+    Writes the statistics filled by a miner in its `stats` dictionary to a JSON file, adding the average size of the
+    tidsets of each depth of an ECLAT search ("avg_tidset_size").
+
+    :param dict stats: Dictionary of the statistics of a run
+    :param str filepath: Path of the JSON file
+    """
+    import json
+
+    stats = dict(stats)
+    if "depths" in stats:
+        stats["depths"] = [dict(depth_stats, avg_tidset_size=depth_stats["tidset_size"] / depth_stats["intersections"]
+                                if depth_stats["intersections"] else 0)
+                           for depth_stats in stats["depths"]]
+    with open(filepath, "w") as f:
+        json.dump(stats, f, indent=2)
+
+
+def eclat_search(prefix_tids, items, vertical_db, min_support, num_transactions, prefix=[], weights=None,
+                 stats=None):
+    """
+    Recursive DFS/ECLAT function to find frequent itemsets.
+    
+    :param list[int] prefix_tids: Set of TIDs (transaction IDs) containing the current prefix
+    :param list items: List of candidate items to extend the current prefix
+    :param dict vertical_db: Vertical database mapping items to sets of TIDs
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param list[items] prefix: Current prefix itemset
+    :param list[int] weights: Optional number of occurrences of each transaction (see `compress_transactions`)
+    :param dict stats: Optional dictionary in which the number of extensions of the frequent itemsets whose support is
+        computed is accumulated under the "nodes" key, and the statistics of each depth under the "depths" key (see
+        `add_depth_stats`)
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    depth = len(prefix) + 1
+    for i in range(len(items)):
+        item = items[i]
+        new_tids = prefix_tids & vertical_db[item]
+        support = len(new_tids) if weights is None else sum(map(weights.__getitem__, new_tids))
+        if stats is not None:
+            add_depth_stats(stats, depth, 1, 1, len(new_tids))
+
+        if support >= min_support:
+            new_prefix = prefix + [int(item)]
+            frequency = support / num_transactions
+            yield (sorted(new_prefix), frequency)
+
+            new_items = items[i+1:]
+            if stats is not None:
+                stats["nodes"] = stats.get("nodes", 0) + len(new_items)
+                tidset_size = 0
+            new_vertical_db = {}
+
+            for next_item in new_items:
+                intersected = vertical_db[next_item] & new_tids
+                if stats is not None:
+                    tidset_size += len(intersected)
+                if weights is None:
+                    if len(intersected) >= min_support:
+                        new_vertical_db[next_item] = intersected
+                elif sum(map(weights.__getitem__, intersected)) >= min_support:
+                    new_vertical_db[next_item] = intersected
+            if stats is not None and new_items:
+                add_depth_stats(stats, depth + 1, 0, len(new_items), tidset_size)
+
+            yield from eclat_search(new_tids, list(new_vertical_db.keys()), new_vertical_db,
+                                    min_support, num_transactions, prefix=new_prefix, weights=weights, stats=stats)
+
+
+def eclat_bitset_search(prefix_tids, items, vertical_db, min_support, num_transactions, prefix=[], stats=None):
+    """
+    Recursive DFS/ECLAT function to find frequent itemsets, on tidsets packed as bitmaps.
+
+    Each tidset is a Python integer whose bit `tid` is set when the transaction `tid` contains the itemset, so that an
+    intersection is a single AND and a support is a popcount.
+
+    :param int prefix_tids: Bitmap of the TIDs (transaction IDs) containing the current prefix
+    :param list items: List of candidate items to extend the current prefix
+    :param dict vertical_db: Vertical database mapping items to bitmaps of TIDs
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param list[items] prefix: Current prefix itemset
+    :param dict stats: Optional dictionary in which the number of extensions of the frequent itemsets whose support is
+        computed is accumulated under the "nodes" key
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    for i in range(len(items)):
+        item = items[i]
+        new_tids = prefix_tids & vertical_db[item]
+        support = new_tids.bit_count()
+
+        if support >= min_support:
+            new_prefix = prefix + [int(item)]
+            frequency = support / num_transactions
+            yield (sorted(new_prefix), frequency)
+
+            new_items = items[i+1:]
+            if stats is not None:
+                stats["nodes"] = stats.get("nodes", 0) + len(new_items)
+            new_vertical_db = {}
+
+            for next_item in new_items:
+                intersected = vertical_db[next_item] & new_tids
+                if intersected.bit_count() >= min_support:
+                    new_vertical_db[next_item] = intersected
+
+            yield from eclat_bitset_search(new_tids, list(new_vertical_db.keys()), new_vertical_db,
+                                           min_support, num_transactions, prefix=new_prefix, stats=stats)
+
+
+def eclat_spill_search(items, arena, min_support, num_transactions, depth=0, prefix=[], stats=None):
+    """
+    Recursive DFS/ECLAT function to find frequent itemsets, on bitmap tidsets held by a `TidsetArena`.
+
+    The tidsets of the frequent extensions of the items at `depth` are stored under the keys `(depth, item)`, and
+    dropped from the arena as soon as their equivalence class is mined, so that only the tidsets of the current DFS
+    path and of its pending siblings are held.
+
+    :param list items: List of frequent items extending the current prefix, whose tidsets are in the arena
+    :param TidsetArena arena: Arena holding the tidsets, under the keys `(depth, item)`
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param int depth: Depth of the current prefix in the search tree
+    :param list[items] prefix: Current prefix itemset
+    :param dict stats: Optional dictionary in which the number of extensions of the frequent itemsets whose support is
+        computed is accumulated under the "nodes" key
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    for i in range(len(items)):
+        item = items[i]
+        new_tids = arena.get((depth, item))
+        new_prefix = prefix + [int(item)]
+        yield (sorted(new_prefix), new_tids.bit_count() / num_transactions)
+
+        new_items = []
+        if stats is not None:
+            stats["nodes"] = stats.get("nodes", 0) + len(items) - i - 1
+        for next_item in items[i+1:]:
+            intersected = arena.get((depth, next_item)) & new_tids
+            if intersected.bit_count() >= min_support:
+                arena.put((depth + 1, next_item), intersected)
+                new_items.append(next_item)
+        del new_tids
+
+        yield from eclat_spill_search(new_items, arena, min_support, num_transactions, depth + 1, new_prefix, stats)
+        arena.free((depth, item))
+
+
+def eclat_diffset_search(prefix_tids, items, vertical_db, min_support, num_transactions, prefix=[], weights=None,
+                         stats=None):
+    """
+    Recursive DFS/dECLAT function to find frequent itemsets, switching from tidsets to diffsets after the first level.
+
+    The items are extended with their tidsets as in `eclat_search`, then every equivalence class below is represented
+    by diffsets: d(PXY) = t(PX) - t(PY) on the first level and d(PXY) = d(PY) - d(PX) deeper, with
+    support(PXY) = support(PX) - |d(PXY)|.
+
+    :param set prefix_tids: Set of TIDs (transaction IDs) containing the current prefix
+    :param list items: List of candidate items to extend the current prefix
+    :param dict vertical_db: Vertical database mapping items to sets of TIDs
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param list[items] prefix: Current prefix itemset
+    :param list[int] weights: Optional number of occurrences of each transaction (see `compress_transactions`)
+    :param dict stats: Optional dictionary in which the number of extensions of the frequent itemsets whose support is
+        computed is accumulated under the "nodes" key
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    for i in range(len(items)):
+        item = items[i]
+        new_tids = prefix_tids & vertical_db[item]
+        support = len(new_tids) if weights is None else sum(map(weights.__getitem__, new_tids))
+
+        if support >= min_support:
+            new_prefix = prefix + [int(item)]
+            yield (sorted(new_prefix), support / num_transactions)
+
+            new_items = items[i+1:]
+            if stats is not None:
+                stats["nodes"] = stats.get("nodes", 0) + len(new_items)
+            new_diffsets = {}
+            new_supports = {}
+
+            for next_item in new_items:
+                diffset = new_tids - vertical_db[next_item]
+                next_support = support - (len(diffset) if weights is None else sum(map(weights.__getitem__, diffset)))
+                if next_support >= min_support:
+                    new_diffsets[next_item] = diffset
+                    new_supports[next_item] = next_support
+
+            yield from declat_search(list(new_diffsets.keys()), new_diffsets, new_supports,
+                                     min_support, num_transactions, prefix=new_prefix, weights=weights, stats=stats)
+
+
+def declat_search(items, diffsets, supports, min_support, num_transactions, prefix=[], weights=None, stats=None):
+    """
+    Recursive DFS/dECLAT function to find frequent itemsets within an equivalence class stored as diffsets.
+
+    :param list items: List of items of the equivalence class, all frequent once appended to the prefix
+    :param dict diffsets: Mapping of each item to the TIDs of the prefix that do not contain the prefix and the item
+    :param dict supports: Mapping of each item to the support count of the prefix extended with the item
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param list[items] prefix: Current prefix itemset
+    :param list[int] weights: Optional number of occurrences of each transaction (see `compress_transactions`)
+    :param dict stats: Optional dictionary in which the number of extensions of the frequent itemsets whose support is
+        computed is accumulated under the "nodes" key
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    for i in range(len(items)):
+        item = items[i]
+        support = supports[item]
+        diffset = diffsets[item]
+
+        new_prefix = prefix + [int(item)]
+        yield (sorted(new_prefix), support / num_transactions)
+
+        new_items = items[i+1:]
+        if stats is not None:
+            stats["nodes"] = stats.get("nodes", 0) + len(new_items)
+        new_diffsets = {}
+        new_supports = {}
+
+        for next_item in new_items:
+            new_diffset = diffsets[next_item] - diffset
+            next_support = support - (len(new_diffset) if weights is None else sum(map(weights.__getitem__, new_diffset)))
+            if next_support >= min_support:
+                new_diffsets[next_item] = new_diffset
+                new_supports[next_item] = next_support
+
+        yield from declat_search(list(new_diffsets.keys()), new_diffsets, new_supports,
+                                 min_support, num_transactions, prefix=new_prefix, weights=weights, stats=stats)
+
+
+def create_vertical_db(transactions):
+    """
+    Builds a vertical database from a list of transactions.
+
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of integer
+        items, or their CSR layout (see `read_transactions`)
+    :return vertical_db (dict): Vertical database mapping items to sets of TIDs (transaction IDs)
+    """
+    if is_csr(transactions):
+        return {item: set(tids.tolist()) for item, tids in get_item_tids_csr(*transactions)}
+
+    vertical_db = {}
+    for tid, transaction in enumerate(transactions):
+        for item in transaction:
+            if item not in vertical_db:
+                vertical_db[item] = set()
+            vertical_db[item].add(tid)
+    return vertical_db
+
+
+def create_vertical_bitset_db(transactions, min_support=0, items=None):
+    """
+    Builds a vertical database from a list of transactions, where tidsets are packed as bitmaps.
+    Items below `min_support` are left out, as a bitmap costs as much as the whole transaction list.
+
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of integer
+        items, or their CSR layout (see `read_transactions`), whose bitmaps are built at once by
+        `build_transaction_bitmap`
+    :param int min_support: Minimum support count for an item to be kept in the vertical database (default: 0)
+    :param set items: Optional items to which the vertical database is restricted
+    :return vertical_db (dict): Vertical database mapping items to integers whose bit `tid` is set for each TID
+    """
+    if is_csr(transactions):
+        kept_items = [item for item, count in get_count_items(transactions).items()
+                      if count >= min_support and (items is None or item in items)]
+        item_rows, bitmap = build_transaction_bitmap(transactions, kept_items)
+        bitmap = bitmap.view("uint8")
+        return {item: int.from_bytes(bitmap[row].tobytes(), "little") for item, row in item_rows.items()}
+
+    num_bytes = (len(transactions) + 7) // 8
+    vertical_db = {}
+    for item, tids in create_vertical_db(transactions).items():
+        if len(tids) < min_support or (items is not None and item not in items):
+            continue
+        bitmap = bytearray(num_bytes)
+        for tid in tids:
+            bitmap[tid >> 3] |= 1 << (tid & 7)
+        vertical_db[item] = int.from_bytes(bitmap, "little")
+    return vertical_db
+
+
+def count_itemsets_bitset(itemsets, transactions):
+    """
+    Counts the number of transactions containing each itemset, by intersecting the tidsets of their items packed as
+    bitmaps (see `create_vertical_bitset_db`). The itemsets are visited depth-first, so that the tidset of an itemset
+    is the one of its prefix, at the top of a stack, intersected with the tidset of its last item.
+
+    :param list[tuple] itemsets: Itemsets, each represented as a sorted tuple of items, sorted, and holding the prefix
+        of each of them
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of integer
+        items, or their CSR layout (see `read_transactions`)
+    :return itemset_counts (dict): Dictionary mapping each itemset to its count
+    """
+    vertical_db = create_vertical_bitset_db(transactions, items=set(itertools.chain.from_iterable(itemsets)))
+    itemset_counts = {}
+    stack = []
+    for itemset in itemsets:
+        while stack and (len(stack[-1][0]) >= len(itemset) or stack[-1][0] != itemset[:len(stack[-1][0])]):
+            stack.pop()
+        tids = vertical_db.get(itemset[-1], 0)
+        if len(itemset) > 1:
+            if not stack or len(stack[-1][0]) != len(itemset) - 1:
+                raise ValueError(f"The prefix of {list(itemset)} is missing from the itemsets")
+            tids &= stack[-1][1]
+        itemset_counts[itemset] = tids.bit_count()
+        stack.append((itemset, tids))
+    return itemset_counts
+
+
+_eclat_worker_state = {}
+
+
+class TidsetArena:
+    """
+    Utility class to hold the bitmap tidsets of an ECLAT search within a memory budget.
+
+    The tidsets are kept in memory, as Python integers, up to the budget. Beyond it, the least recently used ones are
+    written to fixed-size slots of a memory-mapped temporary file, which grows as needed, and read back when they are
+    used again. As tidsets never change, a tidset read back keeps its slot, and is not written again when evicted.
+    """
+
+    def __init__(self, num_transactions, memory_budget, directory=None):
+        """sizes the slots to the bitmaps of `num_transactions` bits, and the cache to `memory_budget` bytes"""
+        import tempfile
+
+        self.num_bytes = max(1, (num_transactions + 7) // 8)
+        self.capacity = max(1, memory_budget // self.num_bytes)
+        self.cache = {}
+        self.slots = {}
+        self.free_slots = []
+        self.num_slots = 0
+        self.file = tempfile.TemporaryFile(dir=directory)
+        self.buffer = None
+        self.spilled = 0
+        self.reloaded = 0
+
+    def put(self, key, tids):
+        """stores the bitmap `tids` under `key`, evicting the least recently used tidsets beyond the budget"""
+        self.cache[key] = tids
+        if len(self.cache) > self.capacity:
+            self.evict()
+
+    def get(self, key):
+        """returns the bitmap stored under `key`, reading it back from the file if it was evicted"""
+        tids = self.cache.pop(key, None)
+        if tids is None:
+            start = self.slots[key] * self.num_bytes
+            tids = int.from_bytes(self.buffer[start:start + self.num_bytes], "little")
+            self.reloaded += 1
+        self.cache[key] = tids
+        if len(self.cache) > self.capacity:
+            self.evict()
+        return tids
+
+    def free(self, key):
+        """drops the tidset stored under `key`, and releases its slot"""
+        self.cache.pop(key, None)
+        slot = self.slots.pop(key, None)
+        if slot is not None:
+            self.free_slots.append(slot)
+
+    def evict(self):
+        """moves the least recently used tidset from memory to its slot of the file"""
+        key = next(iter(self.cache))
+        tids = self.cache.pop(key)
+        if key in self.slots:
+            return
+        if not self.free_slots:
+            self.grow()
+        slot = self.free_slots.pop()
+        start = slot * self.num_bytes
+        self.buffer[start:start + self.num_bytes] = tids.to_bytes(self.num_bytes, "little")
+        self.slots[key] = slot
+        self.spilled += 1
+
+    def grow(self):
+        """
+        doubles the number of slots of the file, and maps it again. The space is allocated beforehand, so that a full
+        disk raises a MemoryError here rather than a bus error when the mapping is written
+        """
+        import mmap
+        import os
+
+        num_slots = max(64, 2 * self.num_slots)
+        try:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(self.file.fileno(), 0, num_slots * self.num_bytes)
+            else:
+                self.file.truncate(num_slots * self.num_bytes)
+        except OSError as e:
+            raise MemoryError(f"Cannot spill more tidsets to the arena file: {e}") from e
+        if self.buffer is not None:
+            self.buffer.close()
+        self.buffer = mmap.mmap(self.file.fileno(), num_slots * self.num_bytes)
+        self.free_slots.extend(range(num_slots - 1, self.num_slots - 1, -1))
+        self.num_slots = num_slots
+
+    def close(self):
+        """unmaps and deletes the file"""
+        if self.buffer is not None:
+            self.buffer.close()
+        self.file.close()
+
+
+def fill_tidset_arena(transactions, min_support, arena):
+    """
+    Builds the bitmap tidsets of the frequent items of the transactions straight into an arena, under the keys
+    `(0, item)`. The bitmaps are built by batches of items taking at most half of the memory budget of the arena, with
+    `build_transaction_bitmap` when NumPy is available, and put in the arena as they are produced, so that the budget
+    also bounds the construction of the first level.
+
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of integer
+        items, or their CSR layout (see `read_transactions`)
+    :param int min_support: Minimum support count for an item to be kept
+    :param TidsetArena arena: Arena in which the tidsets are stored
+    :return items (list): Frequent items, sorted, whose tidsets are in the arena
+    """
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    items = sorted(item for item, count in get_count_items(transactions).items() if count >= min_support)
+    batch_size = max(1, arena.capacity // 2)
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        if numpy is not None:
+            item_rows, bitmap = build_transaction_bitmap(transactions, batch)
+            bitmap = bitmap.view(numpy.uint8)
+            for item, row in item_rows.items():
+                arena.put((0, item), int.from_bytes(bitmap[row].tobytes(), "little"))
+            del bitmap
+        else:
+            bitmaps = {item: bytearray(arena.num_bytes) for item in batch}
+            for tid, transaction in enumerate(transactions):
+                for item in transaction:
+                    bitmap = bitmaps.get(item)
+                    if bitmap is not None:
+                        bitmap[tid >> 3] |= 1 << (tid & 7)
+            for item in batch:
+                arena.put((0, item), int.from_bytes(bitmaps.pop(item), "little"))
+    return items
+
+
+def init_eclat_worker(shm_name, items, num_bytes, min_support, num_transactions):
+    """
+    Initializes a worker of `eclat_parallel` by attaching it to the shared memory block of the vertical database.
+    The block stays attached for the lifetime of the worker, and the bitmaps are read from it by `eclat_class_worker`
+    as they are needed, so that the workers never hold a copy of the whole vertical database.
+
+    :param str shm_name: Name of the shared memory block holding the bitmaps of the items, one after the other
+    :param list items: Items of the vertical database, in the order of their bitmaps
+    :param int num_bytes: Size of the bitmap of an item, in bytes
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    """
+    from multiprocessing import shared_memory
+
+    _eclat_worker_state["shm"] = shared_memory.SharedMemory(name=shm_name)
+    _eclat_worker_state["items"] = items
+    _eclat_worker_state["num_bytes"] = num_bytes
+    _eclat_worker_state["min_support"] = min_support
+    _eclat_worker_state["num_transactions"] = num_transactions
+
+
+def eclat_class_worker(i):
+    """
+    Mines the equivalence class of the i-th item of the vertical database, in a worker of `eclat_parallel`.
+
+    The bitmaps of the item and of the items after it are read from shared memory one at a time, and only the
+    intersections that are frequent are kept, as the vertical database of the class.
+
+    :param int i: Index of the item whose itemsets are mined, along with the items after it
+    :return frequent_itemsets (list): List of frequent itemsets of the class along with their frequencies
+    """
+    buffer = _eclat_worker_state["shm"].buf
+    items = _eclat_worker_state["items"]
+    num_bytes = _eclat_worker_state["num_bytes"]
+    min_support = _eclat_worker_state["min_support"]
+    num_transactions = _eclat_worker_state["num_transactions"]
+
+    item = items[i]
+    tids = int.from_bytes(buffer[i * num_bytes:(i + 1) * num_bytes], "little")
+    all_frequent_itemsets = [([int(item)], tids.bit_count() / num_transactions)]
+
+    new_vertical_db = {}
+    for row in range(i + 1, len(items)):
+        intersected = int.from_bytes(buffer[row * num_bytes:(row + 1) * num_bytes], "little") & tids
+        if intersected.bit_count() >= min_support:
+            new_vertical_db[items[row]] = intersected
+
+    all_frequent_itemsets.extend(eclat_bitset_search(tids, list(new_vertical_db.keys()), new_vertical_db,
+                                                     min_support, num_transactions, prefix=[int(item)]))
+    return all_frequent_itemsets
+
+
+def get_density(transactions, num_items):
+    """
+    Computes the density of a dataset, i.e. the average fraction of the items contained in a transaction.
+
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of integer
+        items, or their CSR layout (see `read_transactions`)
+    :param int num_items: Number of different items in the dataset
+    :return density (float): Density of the dataset, between 0 and 1
+    """
+    if is_csr(transactions):
+        offsets, items = transactions
+        return len(items) / ((len(offsets) - 1) * num_items) if len(offsets) > 1 and num_items else 0
+    if not transactions or num_items == 0:
+        return 0
+    return sum(len(transaction) for transaction in transactions) / (len(transactions) * num_items)
+
+
+def eclat(filepath, minFrequency, is_inginious=False, is_test=False, tidsets="set", dedup=False, reorder=False,
+          stats=None, memory_budget=None):
+    """
+    Runs the ECLAT frequent itemset mining algorithm on the specified file with the given minimum frequency.
+    
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :param str tidsets: Representation of the tidsets, either "set" (Python sets), "bitset" (packed bitmaps),
+        "spill" (packed bitmaps spilled to a memory-mapped file beyond `memory_budget`, see `TidsetArena`), "diffset"
+        (diffsets below the first level) or "auto" (diffsets on datasets denser than `DIFFSET_DENSITY`)
+    :param boolean dedup: Flag indicating whether the transactions are mined as weighted rows, once their infrequent
+        items are removed and the identical ones merged (see `compress_transactions`), only with "set" and "diffset"
+        tidsets (default: False)
+    :param boolean reorder: Flag indicating whether the items are renamed to ranks of ascending support before mining,
+        so that the equivalence classes are extended from the least frequent item (see `remap_items`) (default: False)
+    :param dict stats: Optional dictionary filled with the number of itemsets of two items or more whose support is
+        computed, under the "nodes" key, with "set" tidsets, the statistics of each depth (see `eclat_search`), and
+        with "spill" tidsets, the number of tidsets written to the file
+        ("spilled") and read back from it ("reloaded")
+    :param int memory_budget: Size of the tidsets kept in memory with "spill" tidsets, in bytes
+        (default: `SPILL_MEMORY_BUDGET`)
+    """
+    transactions, num_transactions = read_transactions(filepath, csr=not dedup and not reorder)
+    min_support = minFrequency * num_transactions
+
+    variant_name = "eclat" if tidsets == "set" else f"eclat_{tidsets}"
+    if tidsets == "auto":
+        tidsets = "diffset" if get_density(transactions, len(get_count_items(transactions))) >= DIFFSET_DENSITY else "set"
+
+    weights = None
+    if dedup:
+        if tidsets in ("bitset", "spill"):
+            raise ValueError(f"Weighted rows are not supported with {tidsets} tidsets")
+        transactions, weights = compress_transactions(transactions, min_support)
+    if reorder:
+        transactions, rank_items = remap_items(transactions, min_support, weights)
+    num_rows = num_transactions if weights is None else len(transactions)
+
+    if tidsets == "set":
+        vertical_db = create_vertical_db(transactions)
+        prefix_tids = set(range(num_rows))
+        search = eclat_search
+    elif tidsets == "bitset":
+        vertical_db = create_vertical_bitset_db(transactions, min_support)
+        prefix_tids = (1 << num_transactions) - 1
+        search = eclat_bitset_search
+    elif tidsets == "spill":
+        arena = TidsetArena(num_transactions, SPILL_MEMORY_BUDGET if memory_budget is None else memory_budget)
+        all_items = fill_tidset_arena(transactions, min_support, arena)
+        del transactions
+    elif tidsets == "diffset":
+        vertical_db = create_vertical_db(transactions)
+        if weights is None:
+            vertical_db = {item: tids for item, tids in vertical_db.items() if len(tids) >= min_support}
+        prefix_tids = set(range(num_rows))
+        search = eclat_diffset_search
+    else:
+        raise ValueError(f"Unknown tidsets representation '{tidsets}'")
+
+    if tidsets != "spill":
+        all_items = sorted(vertical_db.keys(), key=lambda x: int(x))
+
+    if stats is not None:
+        stats["nodes"] = 0
+        stats.pop("depths", None)
+    if tidsets == "spill":
+        all_frequent_itemsets = eclat_spill_search(all_items, arena, min_support, num_transactions, stats=stats)
+    elif weights is None:
+        all_frequent_itemsets = search(prefix_tids, all_items, vertical_db, min_support, num_transactions,
+                                       stats=stats)
+    else:
+        all_frequent_itemsets = search(prefix_tids, all_items, vertical_db, min_support, num_transactions,
+                                       weights=weights, stats=stats)
+    if reorder:
+        all_frequent_itemsets = restore_items(all_frequent_itemsets, rank_items)
+
+    try:
+        manage_output(all_frequent_itemsets, variant_name, extract_dataset_name(filepath), minFrequency, is_inginious,
+                      is_test)
+    finally:
+        if tidsets == "spill":
+            if stats is not None:
+                stats["spilled"] = arena.spilled
+                stats["reloaded"] = arena.reloaded
+            arena.close()
+
+
+def eclat_bitset(filepath, minFrequency, is_inginious=False, is_test=False):
+    """
+    Runs the ECLAT algorithm with tidsets packed as bitmaps, on the specified file with the given minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    """
+    eclat(filepath, minFrequency, is_inginious, is_test, tidsets="bitset")
+
+
+def eclat_spill(filepath, minFrequency, is_inginious=False, is_test=False, memory_budget=None):
+    """
+    Runs the ECLAT algorithm with bitmap tidsets kept within a memory budget, beyond which they are spilled to a
+    memory-mapped file, on the specified file with the given minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :param int memory_budget: Size of the tidsets kept in memory, in bytes (default: `SPILL_MEMORY_BUDGET`)
+    """
+    eclat(filepath, minFrequency, is_inginious, is_test, tidsets="spill", memory_budget=memory_budget)
+
+
+def eclat_diffset(filepath, minFrequency, is_inginious=False, is_test=False):
+    """
+    Runs the dECLAT algorithm, which stores diffsets instead of tidsets below the first level, on the specified file
+    with the given minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    """
+    eclat(filepath, minFrequency, is_inginious, is_test, tidsets="diffset")
+
+
+def get_num_cpus():
+    """
+    Returns the number of CPUs the current process may run on, which is less than `os.cpu_count()` when it is bound to
+    some of them (e.g. by `run_experiment.py --pin`).
+
+    :return num_cpus (int): Number of CPUs available to the process
+    """
+    import os
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def eclat_parallel_search(vertical_db, min_support, num_transactions, workers=None):
+    """
+    Spreads the equivalence classes of the first level of ECLAT over a pool of processes.
+
+    The bitmaps of the vertical database are moved once to shared memory, which leaves `vertical_db` empty, and every
+    worker reads them from there (see `eclat_class_worker`), so that the vertical database is held once whatever the
+    number of workers. The classes are handed out one at a time, the ones expected to be the largest (many items after
+    them, high support) first, so that the workers stay busy until the end.
+
+    :param dict vertical_db: Vertical database mapping the frequent items to bitmaps of TIDs, emptied by the call
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param int workers: Number of worker processes (default: number of CPUs available, see `get_num_cpus`)
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    import multiprocessing
+    from multiprocessing import shared_memory
+
+    items = sorted(vertical_db.keys(), key=lambda x: int(x))
+    if not items:
+        return
+    num_bytes = (num_transactions + 7) // 8
+    if workers is None:
+        workers = get_num_cpus()
+
+    shm = shared_memory.SharedMemory(create=True, size=len(items) * num_bytes)
+    try:
+        supports = []
+        for row, item in enumerate(items):
+            tids = vertical_db.pop(item)
+            supports.append(tids.bit_count())
+            shm.buf[row * num_bytes:(row + 1) * num_bytes] = tids.to_bytes(num_bytes, "little")
+        order = sorted(range(len(items)), key=lambda i: -(len(items) - i - 1) * supports[i])
+
+        with multiprocessing.Pool(workers, initializer=init_eclat_worker,
+                                  initargs=(shm.name, items, num_bytes, min_support, num_transactions)) as pool:
+            for frequent_itemsets in pool.imap_unordered(eclat_class_worker, order):
+                yield from frequent_itemsets
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def eclat_parallel(filepath, minFrequency, is_inginious=False, is_test=False, workers=None):
+    """
+    Runs the ECLAT algorithm with bitmap tidsets, spreading the equivalence classes of the first level over a pool of
+    processes (see `eclat_parallel_search`), on the specified file with the given minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :param int workers: Number of worker processes (default: number of CPUs available, see `get_num_cpus`)
+    """
+    transactions, num_transactions = read_transactions(filepath, csr=True)
+    min_support = minFrequency * num_transactions
+
+    vertical_db = create_vertical_bitset_db(transactions, min_support)
+    del transactions
+    all_frequent_itemsets = eclat_parallel_search(vertical_db, min_support, num_transactions, workers)
+
+    manage_output(all_frequent_itemsets, "eclat_parallel", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+
+
+def charm_search(prefix, parts, tidsets, min_support, num_transactions, closed_tidsets):
+    """
+    Recursive CHARM function to find the closed frequent itemsets within an equivalence class, on tidsets packed as
+    bitmaps (see `eclat_bitset_search`).
+
+    Each member X_i of the class is compared with the members X_j after it, on their tidsets t_i and t_j:
+    - t_i = t_j: X_j is merged into X_i and removed from the class, as they always occur together.
+    - t_i < t_j: X_j is merged into X_i, but kept in the class.
+    - t_i > t_j: X_j is removed from the class, as it always occurs with X_i, and X_i + X_j is added to the class of X_i.
+    - otherwise: X_i + X_j is added to the class of X_i, if frequent.
+    An itemset is then output, once its class is mined, unless a closed itemset with the same tidset was already found.
+
+    :param list prefix: Items shared by the members of the class
+    :param list[list] parts: Items added to the prefix by each member of the class
+    :param list[int] tidsets: Bitmap of the TIDs (transaction IDs) containing each member of the class
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param set[int] closed_tidsets: Tidsets of the closed itemsets found so far, filled by the search
+    :return closed_itemsets (generator): Closed frequent itemsets found along with their frequencies
+    """
+    removed = [False] * len(parts)
+    for i in range(len(parts)):
+        if removed[i]:
+            continue
+        tids = tidsets[i]
+        itemset = prefix + parts[i]
+        new_parts = []
+        new_tidsets = []
+
+        for j in range(i + 1, len(parts)):
+            if removed[j]:
+                continue
+            intersected = tids & tidsets[j]
+            if intersected == tids:
+                itemset = itemset + parts[j]
+                removed[j] = intersected == tidsets[j]
+            elif intersected == tidsets[j]:
+                removed[j] = True
+                new_parts.append(parts[j])
+                new_tidsets.append(intersected)
+            elif intersected.bit_count() >= min_support:
+                new_parts.append(parts[j])
+                new_tidsets.append(intersected)
+
+        if new_parts:
+            yield from charm_search(itemset, new_parts, new_tidsets, min_support, num_transactions, closed_tidsets)
+        if tids not in closed_tidsets:
+            closed_tidsets.add(tids)
+            yield (sorted(itemset), tids.bit_count() / num_transactions)
+
+
+def mafia_search(head, head_mask, head_tids, tail, vertical_db, min_support, num_transactions, maximal_masks):
+    """
+    Recursive MAFIA function to find the maximal frequent itemsets below a node of the ECLAT search tree, on tidsets
+    packed as bitmaps (see `eclat_bitset_search`).
+
+    The items are integer ranks (see `remap_items`), so that an itemset is also a bitmask of its items, and the subset
+    check against the maximal itemsets found so far is a single AND each. The subtree is pruned:
+    - HUTMFI: if the head and its whole tail are a subset of a maximal itemset already found.
+    - PEP: the items of the tail in every transaction of the head are moved to the head, instead of being branched on.
+    - FHUT: if the head and its whole frequent tail form a frequent itemset, which is then the only one to check.
+    At the root, where the head is empty, nothing is output when no item is frequent.
+
+    :param list[int] head: Items of the itemset of the node
+    :param int head_mask: Bitmask of the items of the head
+    :param int head_tids: Bitmap of the TIDs (transaction IDs) containing the head
+    :param list[int] tail: Items that can extend the head, in the order of the search
+    :param dict vertical_db: Vertical database mapping the frequent items to bitmaps of TIDs
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param list[int] maximal_masks: Bitmasks of the maximal itemsets found so far, filled by the search
+    :return maximal_itemsets (generator): Maximal frequent itemsets found along with their frequencies
+    """
+    hut_mask = head_mask
+    for item in tail:
+        hut_mask |= 1 << item
+    if any(hut_mask & mask == hut_mask for mask in maximal_masks):
+        return
+
+    head_support = head_tids.bit_count()
+    new_tail = []
+    new_tidsets = []
+    for item in tail:
+        intersected = head_tids & vertical_db[item]
+        support = intersected.bit_count()
+        if support == head_support:
+            head = head + [item]
+            head_mask |= 1 << item
+        elif support >= min_support:
+            new_tail.append(item)
+            new_tidsets.append(intersected)
+
+    if not head and not new_tail:
+        return
+    hut_tids = head_tids
+    for tids in new_tidsets:
+        hut_tids &= tids
+    if hut_tids.bit_count() >= min_support:
+        for item in new_tail:
+            head_mask |= 1 << item
+        if not any(head_mask & mask == head_mask for mask in maximal_masks):
+            maximal_masks.append(head_mask)
+            yield (head + new_tail, hut_tids.bit_count() / num_transactions)
+        return
+
+    for k in range(len(new_tail)):
+        item = new_tail[k]
+        yield from mafia_search(head + [item], head_mask | 1 << item, new_tidsets[k], new_tail[k+1:],
+                                vertical_db, min_support, num_transactions, maximal_masks)
+
+
+def eclat_condensed(filepath, minFrequency, is_inginious=False, is_test=False, mode="closed"):
+    """
+    Runs the ECLAT algorithm with tidsets packed as bitmaps, only keeping the closed (see `charm_search`) or maximal
+    (see `mafia_search`) frequent itemsets, on the specified file with the given minimum frequency. The items are
+    searched in ascending order of support (see `remap_items`).
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :param str mode: Frequent itemsets that are kept, either "closed" or "maximal"
+    """
+    transactions, num_transactions = read_transactions(filepath)
+    min_support = minFrequency * num_transactions
+
+    rows, rank_items = remap_items(transactions, min_support)
+    del transactions
+    vertical_db = create_vertical_bitset_db(rows, min_support)
+    all_items = sorted(vertical_db.keys())
+
+    if mode == "closed":
+        search = charm_search([], [[item] for item in all_items], [vertical_db[item] for item in all_items],
+                              min_support, num_transactions, set())
+    elif mode == "maximal":
+        search = mafia_search([], 0, (1 << num_transactions) - 1, all_items, vertical_db, min_support,
+                              num_transactions, [])
+    else:
+        raise ValueError(f"Unknown mode '{mode}'")
+    all_frequent_itemsets = restore_items(search, rank_items)
+
+    manage_output(all_frequent_itemsets, f"eclat_{mode}", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+
+
+def eclat_closed(filepath, minFrequency, is_inginious=False, is_test=False):
+    """
+    Runs the CHARM algorithm, which only outputs the closed frequent itemsets, on the specified file with the given
+    minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    """
+    eclat_condensed(filepath, minFrequency, is_inginious, is_test, mode="closed")
+
+
+def eclat_maximal(filepath, minFrequency, is_inginious=False, is_test=False):
+    """
+    Runs the MAFIA algorithm, which only outputs the maximal frequent itemsets, on the specified file with the given
+    minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    """
+    eclat_condensed(filepath, minFrequency, is_inginious, is_test, mode="maximal")
+
+
+class TopK:
+    """Utility class to keep the itemsets of the k highest supports, raising the minimum support as they are found."""
+
+    def __init__(self, k, min_support):
+        """
+        starts from a minimum support that is known to be reached by at least k itemsets, e.g. the k-th highest
+        support of the items
+        """
+        self.k = k
+        self.min_support = min_support
+        self.supports = []
+        self.itemsets = []
+
+    def add(self, itemset, support):
+        """keeps `itemset` if its support reaches the minimum support, which is raised to the k-th highest support"""
+        if support < self.min_support:
+            return
+        self.itemsets.append((itemset, support))
+        if len(self.supports) < self.k:
+            heapq.heappush(self.supports, support)
+        else:
+            heapq.heappushpop(self.supports, support)
+        if len(self.supports) == self.k and self.supports[0] > self.min_support:
+            self.min_support = self.supports[0]
+
+    def top_itemsets(self, num_transactions):
+        """Returns the k itemsets of highest support, and those tied with the k-th, from the most frequent"""
+        itemsets = [(itemset, support) for itemset, support in self.itemsets if support >= self.min_support]
+        itemsets.sort(key=lambda x: -x[1])
+        for itemset, support in itemsets:
+            yield (sorted(itemset), support / num_transactions)
+
+
+def get_kth_support(item_counts, k):
+    """
+    Returns the k-th highest support of the items, which is a lower bound on the k-th highest support of the itemsets.
+
+    :param dict item_counts: Dictionary mapping each item to its occurrence count
+    :param int k: Number of itemsets to be found
+    :return min_support (int): Initial minimum support of a top-k search
+    """
+    supports = heapq.nlargest(k, item_counts.values())
+    return supports[-1] if len(supports) == k else 1
+
+
+def eclat_topk_search(items, vertical_db, top_k, num_transactions):
+    """
+    Best-first ECLAT function to find the top-k frequent itemsets, on tidsets packed as bitmaps (see
+    `eclat_bitset_search`).
+
+    The nodes of the search tree are expanded from the highest support, taken from a max-heap, and every extension
+    reaching the minimum support of `top_k` is added to it, which raises that minimum support. As the support of an
+    itemset is at most the one of its prefix, the search stops at the first node below the minimum support.
+
+    :param list items: Items of the vertical database, in the order in which they extend the itemsets
+    :param dict vertical_db: Vertical database mapping items to bitmaps of TIDs
+    :param TopK top_k: Itemsets of the highest supports found so far, filled by the search
+    :param int num_transactions: Total number of transactions
+    """
+    queue = [(-num_transactions, 0, [], (1 << num_transactions) - 1, items)]
+    pushed = 1
+    while queue:
+        negative_support, _, prefix, prefix_tids, tail = heapq.heappop(queue)
+        if -negative_support < top_k.min_support:
+            break
+
+        for i in range(len(tail)):
+            item = tail[i]
+            new_tids = prefix_tids & vertical_db[item]
+            support = new_tids.bit_count()
+            if support >= top_k.min_support:
+                new_prefix = prefix + [item]
+                top_k.add(new_prefix, support)
+                heapq.heappush(queue, (-support, pushed, new_prefix, new_tids, tail[i+1:]))
+                pushed += 1
+
+
+def eclat_topk(filepath, k, is_inginious=False, is_test=False):
+    """
+    Runs the ECLAT algorithm with tidsets packed as bitmaps, finding the k itemsets of highest support (along with
+    those tied with the k-th) instead of the itemsets above a minimum frequency, on the specified file.
+
+    :param filepath: Path to the transaction dataset file
+    :param int k: Number of itemsets to be found
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    """
+    transactions, num_transactions = read_transactions(filepath)
+    min_support = get_kth_support(get_count_items(transactions), k)
+
+    rows, rank_items = remap_items(transactions, min_support)
+    del transactions
+    vertical_db = create_vertical_bitset_db(rows, min_support)
+    all_items = sorted(vertical_db.keys())
+
+    top_k = TopK(k, min_support)
+    eclat_topk_search(all_items, vertical_db, top_k, num_transactions)
+    all_frequent_itemsets = restore_items(top_k.top_itemsets(num_transactions), rank_items)
+
+    manage_output(all_frequent_itemsets, "eclat_topk", extract_dataset_name(filepath), f"top{k}", is_inginious, is_test)
+
+
+class FPNode:
+    """Node of an FP-tree, counting the transactions sharing the path from the root down to it."""
+
+    __slots__ = ("item", "count", "parent", "children")
+
+    def __init__(self, item, parent):
+        """initializes an empty node for `item` below `parent`"""
+        self.item = item
+        self.count = 0
+        self.parent = parent
+        self.children = {}
+
+
+class FPTree:
+    """Utility class to build an FP-tree from (possibly conditional) weighted transactions."""
+
+    def __init__(self, transactions, min_support):
+        """
+        builds the tree from a list of (items, count) pairs, keeping only the items whose support reaches min_support
+        """
+        self.supports = {}
+        for items, count in transactions:
+            for item in items:
+                self.supports[item] = self.supports.get(item, 0) + count
+        self.supports = {item: support for item, support in self.supports.items() if support >= min_support}
+
+        self.root = FPNode(None, None)
+        self.header = {item: [] for item in self.supports}
+        for items, count in transactions:
+            path = sorted((item for item in items if item in self.supports), key=lambda x: (-self.supports[x], x))
+            node = self.root
+            for item in path:
+                child = node.children.get(item)
+                if child is None:
+                    child = FPNode(item, node)
+                    node.children[item] = child
+                    self.header[item].append(child)
+                child.count += count
+                node = child
+
+    def single_path(self):
+        """Returns the nodes of the tree from top to bottom if it is a single path, None otherwise"""
+        path = []
+        node = self.root
+        while node.children:
+            if len(node.children) > 1:
+                return None
+            node = next(iter(node.children.values()))
+            path.append(node)
+        return path
+
+    def conditional_pattern_base(self, item):
+        """Returns the prefix paths of `item` in the tree, as (items, count) pairs"""
+        pattern_base = []
+        for node in self.header[item]:
+            path = []
+            parent = node.parent
+            while parent.item is not None:
+                path.append(parent.item)
+                parent = parent.parent
+            if path:
+                pattern_base.append((path, node.count))
+        return pattern_base
+
+
+def fp_growth_search(tree, min_support, num_transactions, prefix=[]):
+    """
+    Recursive FP-Growth function to find the frequent itemsets of an FP-tree.
+
+    When the tree is a single path, every combination of its nodes is frequent and is enumerated directly, with the
+    count of its deepest node as support. Otherwise, each item is mined from its conditional FP-tree.
+
+    :param FPTree tree: FP-tree of the transactions containing the current prefix
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param list[items] prefix: Current prefix itemset
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    path = tree.single_path()
+    if path is not None:
+        for size in range(1, len(path) + 1):
+            for combination in itertools.combinations(path, size):
+                itemset = prefix + [int(node.item) for node in combination]
+                yield (sorted(itemset), combination[-1].count / num_transactions)
+        return
+
+    for item in sorted(tree.supports, key=lambda x: (tree.supports[x], x)):
+        new_prefix = prefix + [int(item)]
+        yield (sorted(new_prefix), tree.supports[item] / num_transactions)
+
+        conditional_tree = FPTree(tree.conditional_pattern_base(item), min_support)
+        if conditional_tree.supports:
+            yield from fp_growth_search(conditional_tree, min_support, num_transactions, new_prefix)
+
+
+def fp_growth(filepath, minFrequency, is_inginious=False, is_test=False):
+    """
+    Runs the FP-Growth frequent itemset mining algorithm on the specified file with the given minimum frequency.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    """
+    transactions, num_transactions = read_transactions(filepath)
+    min_support = minFrequency * num_transactions
+
+    tree = FPTree([(transaction, 1) for transaction in transactions], min_support)
+    all_frequent_itemsets = fp_growth_search(tree, min_support, num_transactions)
+
+    manage_output(all_frequent_itemsets, "fp_growth", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+
+
+def mine_itemsets(transactions, num_transactions, min_support, algorithm="eclat"):
+    """
+    Mines the frequent itemsets of a list of transactions with the search of one of the variants.
+
+    :param list[frozenset] | tuple transactions: List of transactions, each represented as a frozenset of integer
+        items, or their CSR layout (see `read_transactions`), which only the ECLAT variants consume as is
+    :param int num_transactions: Total number of transactions (used for frequency calculation)
+    :param int min_support: Minimum support count required to consider itemset frequent
+    :param str algorithm: Name of the variant, either "eclat", "eclat_bitset", "eclat_diffset", "fp_growth",
+        "apriori_pruning" or "apriori_no_pruning"
+    :return frequent_itemsets (generator): Frequent itemsets found along with their frequencies
+    """
+    if is_csr(transactions) and algorithm not in ("eclat", "eclat_bitset", "eclat_diffset"):
+        transactions = transactions_from_csr(*transactions)
+    if algorithm in ("eclat", "eclat_diffset"):
+        vertical_db = create_vertical_db(transactions)
+        vertical_db = {item: tids for item, tids in vertical_db.items() if len(tids) >= min_support}
+        search = eclat_search if algorithm == "eclat" else eclat_diffset_search
+        return search(set(range(num_transactions)), sorted(vertical_db.keys()), vertical_db, min_support,
+                      num_transactions)
+    if algorithm == "eclat_bitset":
+        vertical_db = create_vertical_bitset_db(transactions, min_support)
+        return eclat_bitset_search((1 << num_transactions) - 1, sorted(vertical_db.keys()), vertical_db, min_support,
+                                   num_transactions)
+    if algorithm == "fp_growth":
+        tree = FPTree([(transaction, 1) for transaction in transactions], min_support)
+        return fp_growth_search(tree, min_support, num_transactions)
+    if algorithm in ("apriori_pruning", "apriori_no_pruning"):
+        return apriori_search(transactions, min_support, num_transactions, algorithm == "apriori_pruning")
+    raise ValueError(f"Unknown algorithm '{algorithm}'")
+
+
+def sweep(filepath, minFrequencies, algorithm="eclat", is_inginious=False, is_test=False):
+    """
+    Runs a variant once at the lowest of several minimum frequencies on the specified file, then outputs the frequent
+    itemsets of every minimum frequency by filtering that result, as each of them is a subset of it.
+
+    The itemsets are held in memory, sorted by decreasing support, so that the itemsets of a minimum frequency are a
+    prefix of them, found by a binary search.
+
+    :param filepath: Path to the transaction dataset file
+    :param list[float] minFrequencies: Minimum frequency thresholds to determine frequent itemsets
+    :param str algorithm: Name of the variant (see `mine_itemsets`), under which the results are output
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :return timings (dict): Time spent reading and mining the dataset once, under the "mining" key, and time spent
+        filtering and outputting the itemsets of each minimum frequency, as a dictionary under the "filtering" key
+    """
+    import bisect
+
+    start_time = time.perf_counter()
+    transactions, num_transactions = read_transactions(filepath)
+    all_frequent_itemsets = list(mine_itemsets(transactions, num_transactions, min(minFrequencies) * num_transactions,
+                                               algorithm))
+    del transactions
+    all_frequent_itemsets.sort(key=lambda x: -x[1])
+    negative_supports = [-round(frequency * num_transactions) for _, frequency in all_frequent_itemsets]
+    timings = {"mining": time.perf_counter() - start_time, "filtering": {}}
+
+    dataset_name = extract_dataset_name(filepath)
+    for minFrequency in sorted(set(minFrequencies), reverse=True):
+        start_time = time.perf_counter()
+        end = bisect.bisect_right(negative_supports, -minFrequency * num_transactions)
+        manage_output(itertools.islice(all_frequent_itemsets, end), algorithm, dataset_name, minFrequency,
+                      is_inginious, is_test)
+        timings["filtering"][minFrequency] = time.perf_counter() - start_time
+    return timings
+
+
+def get_negative_border(itemsets):
+    """
+    Computes the negative border of a collection of itemsets closed under subsets, i.e. the itemsets of two items or
+    more that are not in the collection while all their subsets are. The items that are not in the collection are left
+    out, as they are not known from the collection alone.
+
+    :param set[tuple] itemsets: Itemsets closed under subsets, each represented as a sorted tuple of items
+    :return negative_border (set[tuple]): Itemsets of the negative border, each represented as a sorted tuple of items
+    """
+    levels = {}
+    for itemset in itemsets:
+        levels.setdefault(len(itemset), set()).add(itemset)
+
+    negative_border = set()
+    for size, level in levels.items():
+        negative_border.update(generate_candidates(level) - levels.get(size + 1, set()))
+    return negative_border
+
+
+def toivonen(filepath, minFrequency, is_inginious=False, is_test=False, sample_size=None, slack=None,
+             algorithm="eclat_bitset", seed=None, stats=None):
+    """
+    Runs Toivonen's sampling algorithm on the specified file with the given minimum frequency.
+
+    A random sample of the transactions is mined with a minimum frequency lowered by the fraction `slack` of it, but
+    never below one transaction of the sample, using the given variant.
+    The itemsets found and their negative border (see `get_negative_border`) are then counted on all the transactions,
+    read once, along with all the items (see `count_itemsets_bitset`, the itemsets of the sample holding the prefixes
+    of every counted itemset). The frequent ones are output, and they are all the frequent itemsets unless an itemset
+    of the negative border is frequent, in which case some of its supersets may be missing and a second pass is
+    needed.
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :param int sample_size: Number of transactions in the sample (default: `SAMPLE_SIZE`)
+    :param float slack: Fraction by which the minimum frequency is lowered on the sample (default: `SAMPLE_SLACK`)
+    :param str algorithm: Name of the variant mining the sample (see `mine_itemsets`)
+    :param int seed: Optional seed of the random sample
+    :param dict stats: Optional dictionary filled with the size of the sample ("sample_size"), the number of itemsets
+        found in the sample ("sample_itemsets") and in their negative border ("border"), and the frequent itemsets of
+        the negative border ("border_frequent")
+    :return status (str): "exact" if the output holds all the frequent itemsets, "needs second pass" otherwise. When
+        the output is saved to a file, the status is also saved next to it, with a ".status" suffix.
+    """
+    import os
+    import random
+
+    if sample_size is None:
+        sample_size = SAMPLE_SIZE
+    if slack is None:
+        slack = SAMPLE_SLACK
+
+    transactions, num_transactions = read_transactions(filepath)
+    min_support = minFrequency * num_transactions
+
+    sample = random.Random(seed).sample(transactions, min(sample_size, num_transactions))
+    sample_frequency = max(minFrequency * (1 - slack), 1 / max(len(sample), 1))
+    sample_itemsets = {tuple(sorted(itemset)) for itemset, _ in
+                       mine_itemsets(sample, len(sample), sample_frequency * len(sample), algorithm)}
+    negative_border = get_negative_border(sample_itemsets)
+
+    candidate_counts = {(item,): count for item, count in get_count_items(transactions).items()}
+    candidate_counts.update(count_itemsets_bitset(sorted(sample_itemsets | negative_border), transactions))
+
+    frequent_itemsets = {itemset: count for itemset, count in candidate_counts.items() if count >= min_support}
+    # Every itemset counted outside of the sample itemsets is an item or an itemset of their negative border
+    border_frequent = [itemset for itemset in frequent_itemsets if itemset not in sample_itemsets]
+    status = "needs second pass" if border_frequent else "exact"
+    if stats is not None:
+        stats["sample_size"] = len(sample)
+        stats["sample_itemsets"] = len(sample_itemsets)
+        stats["border"] = len(candidate_counts) - len(sample_itemsets)
+        stats["border_frequent"] = border_frequent
+
+    all_frequent_itemsets = ((list(itemset), count / num_transactions) for itemset, count in frequent_itemsets.items())
+    manage_output(all_frequent_itemsets, "toivonen", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+    if not is_inginious and not is_test:
+        with open(os.path.join("solutions/toivonen", f"{extract_dataset_name(filepath)}_{minFrequency}.status"), "w") as f:
+            f.write(status + "\n")
+    return status
+
+
+def partition_itemsets(filepath, minFrequency, memory_budget=None, algorithm="eclat", stats=None):
+    """
+    Runs the Partition algorithm of Savasere et al. on the specified file with the given minimum frequency, without
+    ever loading the whole file (see `iter_transaction_chunks`), whose partitions are read in place from its binary
+    cache when it is up to date.
+
+    A first pass over the file mines each partition with the given variant, at the minimum frequency applied to the
+    size of the partition. As an itemset that is frequent in the whole file is frequent in at least one partition, the
+    union of the local frequent itemsets holds all of them. A second pass counts these candidates on every partition
+    (see `count_itemsets_bitset`), and only the ones frequent in the whole file are kept.
+
+    :param filepath: Path to the transaction dataset file
+    :param float minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param int memory_budget: Size of the transactions of a partition, in bytes (default: `PARTITION_MEMORY_BUDGET`)
+    :param str algorithm: Name of the variant mining each partition (see `mine_itemsets`)
+    :param dict stats: Optional dictionary filled with the number of partitions ("partitions") and of candidates
+        ("candidates")
+    :return all_frequent_itemsets (list[Tuple]): Frequent itemsets, with their frequency
+    """
+    if memory_budget is None:
+        memory_budget = PARTITION_MEMORY_BUDGET
+
+    candidates = set()
+    num_transactions = 0
+    num_partitions = 0
+    for partition in iter_transaction_chunks(filepath, memory_budget, csr=True):
+        partition_size = len(partition[0]) - 1 if is_csr(partition) else len(partition)
+        num_transactions += partition_size
+        num_partitions += 1
+        for itemset, _ in mine_itemsets(partition, partition_size, minFrequency * partition_size, algorithm):
+            candidates.add(tuple(sorted(itemset)))
+    candidates = sorted(candidates)
+
+    candidate_counts = dict.fromkeys(candidates, 0)
+    for partition in iter_transaction_chunks(filepath, memory_budget, csr=True):
+        for itemset, count in count_itemsets_bitset(candidates, partition).items():
+            candidate_counts[itemset] += count
+    if stats is not None:
+        stats["partitions"] = num_partitions
+        stats["candidates"] = len(candidates)
+
+    min_support = minFrequency * num_transactions
+    return [(list(itemset), count / num_transactions) for itemset, count in candidate_counts.items()
+            if count >= min_support]
+
+
+def partition_miner(filepath, minFrequency, is_inginious=False, is_test=False, memory_budget=None, algorithm="eclat",
+                    stats=None):
+    """
+    Runs the Partition algorithm on the specified file with the given minimum frequency, with partitions of bounded
+    size (see `partition_itemsets`).
+
+    :param filepath: Path to the transaction dataset file
+    :param int minFrequency: Minimum frequency threshold to determine frequent itemsets
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    :param int memory_budget: Size of the transactions of a partition, in bytes (default: `PARTITION_MEMORY_BUDGET`)
+    :param str algorithm: Name of the variant mining each partition (see `mine_itemsets`)
+    :param dict stats: Optional dictionary filled with the number of partitions and of candidates
+    """
+    all_frequent_itemsets = partition_itemsets(filepath, minFrequency, memory_budget, algorithm, stats)
+    manage_output(all_frequent_itemsets, "partition", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+
+
+def fp_growth_topk_search(tree, top_k, prefix=[]):
+    """
+    Recursive FP-Growth function to find the top-k frequent itemsets of an FP-tree. The items are mined from the most
+    frequent, and each conditional FP-tree is built with the minimum support of `top_k` reached so far.
+
+    :param FPTree tree: FP-tree of the transactions containing the current prefix
+    :param TopK top_k: Itemsets of the highest supports found so far, filled by the search
+    :param list[items] prefix: Current prefix itemset
+    """
+    path = tree.single_path()
+    if path is not None:
+        for size in range(1, len(path) + 1):
+            for combination in itertools.combinations(path, size):
+                top_k.add(prefix + [int(node.item) for node in combination], combination[-1].count)
+        return
+
+    for item in sorted(tree.supports, key=lambda x: (-tree.supports[x], x)):
+        if tree.supports[item] < top_k.min_support:
+            break
+        new_prefix = prefix + [int(item)]
+        top_k.add(new_prefix, tree.supports[item])
+
+        conditional_tree = FPTree(tree.conditional_pattern_base(item), top_k.min_support)
+        if conditional_tree.supports:
+            fp_growth_topk_search(conditional_tree, top_k, new_prefix)
+
+
+def fp_growth_topk(filepath, k, is_inginious=False, is_test=False):
+    """
+    Runs the FP-Growth algorithm, finding the k itemsets of highest support (along with those tied with the k-th)
+    instead of the itemsets above a minimum frequency, on the specified file.
+
+    :param filepath: Path to the transaction dataset file
+    :param int k: Number of itemsets to be found
+    :param boolean is_inginious: Flag indicating whether this run is for Inginious or not (default: False)
+    :param boolean is_test: Flag indicating whether this run is a test or not (default: True)
+    """
+    transactions, num_transactions = read_transactions(filepath)
+    min_support = get_kth_support(get_count_items(transactions), k)
 
-    prefix_tids = set(range(num_transactions))
-    all_frequent_itemsets = eclat_search(prefix_tids, all_items, vertical_db, min_support, num_transactions)
+    tree = FPTree([(transaction, 1) for transaction in transactions], min_support)
+    top_k = TopK(k, min_support)
+    fp_growth_topk_search(tree, top_k)
+    all_frequent_itemsets = top_k.top_itemsets(num_transactions)
 
-    manage_output(all_frequent_itemsets, "eclat", extract_dataset_name(filepath), minFrequency, is_inginious, is_test)
+    manage_output(all_frequent_itemsets, "fp_growth_topk", extract_dataset_name(filepath), f"top{k}", is_inginious, is_test)
 
 
 def apriori(filepath, minFrequency):
@@ -1,4 +1,4 @@
-from frequent_itemset_miner import apriori_no_pruning, apriori_pruning, eclat
+from frequent_itemset_miner import apriori_bitmap, apriori_no_pruning, apriori_pruning, eclat, eclat_bitset, eclat_closed, eclat_diffset, eclat_maximal, eclat_parallel, eclat_spill, fp_growth, partition_miner, sweep, toivonen
 import sys
 import time
 import csv
@@ -43,6 +43,23 @@ DATASETS = {
     ],
 }
 
+ALGORITHMS = {
+    "apriori_no_pruning": apriori_no_pruning,
+    "apriori_pruning": apriori_pruning,
+    "apriori_bitmap": apriori_bitmap,
+    "eclat": eclat,
+    "eclat_bitset": eclat_bitset,
+    "eclat_diffset": eclat_diffset,
+    "eclat_parallel": eclat_parallel,
+    "eclat_closed": eclat_closed,
+    "eclat_maximal": eclat_maximal,
+    "toivonen": toivonen,
+    "partition": partition_miner,
+    "eclat_spill": eclat_spill,
+    "fp_growth": fp_growth,
+}
+SWEEP_ALGORITHMS = ["eclat", "eclat_bitset", "eclat_diffset", "fp_growth", "apriori_pruning", "apriori_no_pruning"]
+
 
 def setup_results_file(algorithm):
     """
@@ -77,6 +94,69 @@ def save_results(algorithm, run, dataset, threshold, elapsed_time):
         writer.writerow([run, dataset, threshold, round(elapsed_time, 6)])
 
 
+def setup_sweep_results_file(algorithm):
+    """
+    Ensures that the sweep results CSV file is created from scratch for each new execution.
+
+    :param str algorithm: Name of the algorithm variant
+    """
+    filename = f"results_experiment/{algorithm}_sweep.csv"
+    os.makedirs("results_experiment", exist_ok=True)
+
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["run", "dataset", "threshold", "mining_time", "filter_time"])
+
+
+def save_sweep_results(algorithm, run, dataset, timings):
+    """
+    Saves the timings of a sweep (see `sweep`) into a CSV file, one row per threshold with the shared mining time.
+    The CSV file is stored at results_experiment/{algorithm}_sweep.csv.
+
+    :param str algorithm: Name of the algorithm variant
+    :param int run: Run number
+    :param str dataset: Name of the dataset
+    :param dict timings: Mining time and filtering time of each threshold, as returned by `sweep`
+    """
+    filename = f"results_experiment/{algorithm}_sweep.csv"
+
+    with open(filename, mode="a", newline="") as file:
+        writer = csv.writer(file)
+        for threshold, filter_time in timings["filtering"].items():
+            writer.writerow([run, dataset, threshold, round(timings["mining"], 6), round(filter_time, 6)])
+
+
+def generate_sweep_res(dataset_name, algorithm, num_runs):
+    """
+    Mines each dataset once per run at its lowest threshold, and derives the results of its other thresholds from it.
+
+    :param str dataset_name: Name of the dataset to run the algorithm on
+    :param str algorithm: Name of the algorithm variant
+    :param int num_runs: Number of times the algorithm is run
+    """
+    if algorithm not in SWEEP_ALGORITHMS:
+        print(f"Error: Unknown algorithm '{algorithm}' for a sweep.")
+        print("Available algorithms:", ", ".join(SWEEP_ALGORITHMS))
+        sys.exit(1)
+
+    if dataset_name == "all":
+        names = [key for key in DATASETS.keys() if key != "toy"]
+    elif dataset_name in DATASETS:
+        names = [dataset_name]
+    else:
+        print(f"Error: Unknown dataset '{dataset_name}'.")
+        print("Available datasets:", ", ".join(DATASETS.keys()) + ", all")
+        sys.exit(1)
+
+    setup_sweep_results_file(algorithm)
+
+    for i in range(int(num_runs)):
+        for name in tqdm(names, desc=f"Sweep [{i+1}/{num_runs}] for `{algorithm}`"):
+            filepath = DATASETS[name][0][0]
+            thresholds = [min_freq for _, min_freq in DATASETS[name]]
+            save_sweep_results(algorithm, i+1, name, sweep(filepath, thresholds, algorithm, False, True))
+
+
 def generate_res(dataset_name, algorithm, num_runs):
     """
     Runs the specified algorithm on the given dataset(s) multiple times, measuring execution time and saving results.
@@ -85,6 +165,11 @@ def generate_res(dataset_name, algorithm, num_runs):
     :param str algorithm: Name of the algorithm variant
     :param int num_runs: Number of times the algorithm is run
     """
+    if algorithm not in ALGORITHMS:
+        print(f"Error: Unknown algorithm '{algorithm}'.")
+        print("Available algorithms:", ", ".join(ALGORITHMS.keys()))
+        sys.exit(1)
+
     setup_results_file(algorithm)
     
     for i in range(int(num_runs)):
@@ -94,16 +179,7 @@ def generate_res(dataset_name, algorithm, num_runs):
                     
                     start_time = time.time()
                     
-                    if algorithm == "apriori_no_pruning":
-                        apriori_no_pruning(filepath, min_freq, False, True)
-                    elif algorithm == "apriori_pruning":
-                        apriori_pruning(filepath, min_freq, False, True)
-                    elif algorithm == "eclat":
-                        eclat(filepath, min_freq, False, True)
-                    else:
-                        print(f"Error: Unknown algorithm '{algorithm}'.")
-                        print("Available algorithms: apriori_no_pruning, apriori_pruning, eclat")
-                        sys.exit(1)
+                    ALGORITHMS[algorithm](filepath, min_freq, False, True)
                     
                     save_results(algorithm, i+1, name, min_freq, time.time() - start_time)
         
@@ -112,18 +188,9 @@ def generate_res(dataset_name, algorithm, num_runs):
 
                 start_time = time.time()
 
-                if algorithm == "apriori_no_pruning":
-                    apriori_no_pruning(filepath, min_freq, False, True)
-                elif algorithm == "apriori_pruning":
-                    apriori_pruning(filepath, min_freq, False, True)
-                elif algorithm == "eclat":
-                    eclat(filepath, min_freq, False, True)
-                else:
-                    print(f"Error: Unknown algorithm '{algorithm}'.")
-                    print("Available algorithms: apriori_no_pruning, apriori_pruning, eclat")
-                    sys.exit(1)
-
-                save_results(algorithm, i+1, name, min_freq, time.time() - start_time)
+                ALGORITHMS[algorithm](filepath, min_freq, False, True)
+
+                save_results(algorithm, i+1, dataset_name, min_freq, time.time() - start_time)
         
         else:
             print(f"Error: Unknown dataset '{dataset_name}'.")
@@ -132,10 +199,13 @@ def generate_res(dataset_name, algorithm, num_runs):
 
 
 if __name__ == "__main__":
+    sweep_mode = "--sweep" in sys.argv
+    sys.argv = [arg for arg in sys.argv if arg != "--sweep"]
     if len(sys.argv) != 4:
-        print("Usage: python generate_resolutions.py <dataset_name> <algorithm> <num_runs>\n")
+        print("Usage: python generate_resolutions.py <dataset_name> <algorithm> <num_runs> [--sweep]\n")
         print("Note: toy is not run if <dataset_name> is set to 'all'.")
-        print("Warning: using a high value for <num_runs> may take a long time to complete.\n")
+        print("Warning: using a high value for <num_runs> may take a long time to complete.")
+        print("Note: with --sweep, each dataset is mined once at its lowest threshold, then filtered for the others.\n")
         print("Example: python generate_resolutions.py toy apriori 1\n")
         sys.exit(1)
 
@@ -143,4 +213,7 @@ if __name__ == "__main__":
         print("Error: Number of runs must be a positive integer.")
         sys.exit(1)
     
-    generate_res(sys.argv[1], sys.argv[2], int(sys.argv[3]))
+    if sweep_mode:
+        generate_sweep_res(sys.argv[1], sys.argv[2], int(sys.argv[3]))
+    else:
+        generate_res(sys.argv[1], sys.argv[2], int(sys.argv[3]))
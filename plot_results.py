@@ -7,11 +7,21 @@ import seaborn as sns
 RESULTS_DIR = "results_experiment/"
 PLOTS_DIR = "plots/"
 DATASETS = {"accidents", "chess", "connect", "mushroom", "pumsb", "retail"}
-ALGORITHMS = {"apriori_no_pruning", "apriori_pruning", "eclat"}
+ALGORITHMS = {"apriori_no_pruning", "apriori_pruning", "eclat", "eclat_bitset", "eclat_diffset", "fp_growth", "apriori_bitmap", "eclat_parallel", "eclat_closed", "eclat_maximal", "toivonen", "partition", "eclat_spill"}
 ALGORITHMS_NAMES = {
         "apriori_no_pruning": "Apriori Naive",
         "apriori_pruning": "Apriori Pruning",
-        "eclat": "Eclat"
+        "apriori_bitmap": "Apriori Bitmap",
+        "eclat": "Eclat",
+        "eclat_bitset": "Eclat Bitset",
+        "eclat_diffset": "dEclat",
+        "eclat_parallel": "Eclat Parallel",
+        "eclat_closed": "Eclat Closed (CHARM)",
+        "eclat_maximal": "Eclat Maximal (MAFIA)",
+        "toivonen": "Toivonen Sampling",
+        "partition": "Partition (Out-of-Core)",
+        "eclat_spill": "ECLAT (Spilled Tidsets)",
+        "fp_growth": "FP-Growth"
     }
 
 
@@ -62,7 +72,7 @@ def plot_algorithm_results(algorithm_name):
 
 def load_dataset_results(dataset_name):
     df = pd.read_csv(os.path.join(RESULTS_DIR, dataset_name + ".csv"))
-    df = df.dropna()
+    df = df.dropna(subset=["time"])
     return df
 
 def plot_dataset_runtime(df, dataset_name):
@@ -122,16 +132,17 @@ def plot_dataset_runtime(df, dataset_name):
     plt.close()
 
 
-def plot_dataset_memory(df, dataset_name):
+def plot_dataset_memory(df, dataset_name, column="max_memory", suffix="memory"):
     """
-    Plots the runtime of algorithms over different thresholds for a dataset.
+    Plots the memory of algorithms over different thresholds for a dataset, measured by `column`: the peak RSS
+    ("max_memory" or "ru_maxrss") or the peak size of the Python allocations ("tracemalloc_peak").
     """
     import matplotlib.ticker as mticker
     df["threshold_pct"] = df["threshold"] * 100
 
-    agg_df = df.groupby(["threshold_pct", "algorithm"]).agg(
-        mean_memory=("max_memory", "mean"),
-        std_memory=("max_memory", "std")
+    agg_df = df.dropna(subset=[column]).groupby(["threshold_pct", "algorithm"]).agg(
+        mean_memory=(column, "mean"),
+        std_memory=(column, "std")
     ).reset_index()
     min_x = agg_df["threshold_pct"].min()
     max_x = agg_df["threshold_pct"].max()
@@ -174,10 +185,36 @@ def plot_dataset_memory(df, dataset_name):
     plt.gca().invert_xaxis()
     plt.tight_layout()
 
-    plt.savefig(f"{PLOTS_DIR}/{dataset_name}_memory.png", dpi=300)
+    plt.savefig(f"{PLOTS_DIR}/{dataset_name}_{suffix}.png", dpi=300)
     plt.close()
 
 
+def plot_dataset_phases(df, dataset_name):
+    """
+    Plots, for each algorithm, the mean time spent reading the transactions, mining the itemsets and writing them, as
+    stacked bars over the thresholds for a dataset.
+    """
+    phases = {"parse_time": "Parse", "mining_time": "Mining", "output_time": "Output"}
+    df = df.dropna(subset=list(phases))
+    agg_df = df.groupby(["algorithm", "threshold"])[list(phases)].mean().rename(columns=phases)
+    algorithms = [algorithm for algorithm in ALGORITHMS_NAMES if algorithm in agg_df.index.get_level_values(0)]
+
+    fig, axes = plt.subplots(len(algorithms), 1, figsize=(7, 2.5 * len(algorithms)), squeeze=False)
+    sns.set_style("white")
+    for ax, algorithm in zip(axes[:, 0], algorithms):
+        algorithm_df = agg_df.loc[algorithm].sort_index(ascending=False)
+        algorithm_df.index = [f"{threshold * 100:g}" for threshold in algorithm_df.index]
+        algorithm_df.plot.bar(stacked=True, ax=ax, color=["lightgrey", "dimgrey", "black"], rot=0, legend=False)
+        ax.set_title(ALGORITHMS_NAMES[algorithm])
+        ax.set_ylabel("Time (s)")
+    axes[-1, 0].set_xlabel("Minimum Support (%)")
+    axes[0, 0].legend(loc="upper left", frameon=False)
+
+    fig.tight_layout()
+    fig.savefig(f"{PLOTS_DIR}/{dataset_name}_phases.png", dpi=300)
+    plt.close(fig)
+
+
 # def plot_dataset_memory(df, dataset_name):
 #     """
 #     Plots a bar plot of max memory usage per algorithm, grouped by threshold using catplot.
@@ -231,6 +268,11 @@ def plot_dataset_results(dataset_name):
     df = load_dataset_results(dataset_name)
     plot_dataset_runtime(df, dataset_name)
     plot_dataset_memory(df, dataset_name)
+    if "ru_maxrss" in df.columns:
+        plot_dataset_memory(df, dataset_name, "ru_maxrss", "ru_maxrss")
+        plot_dataset_phases(df, dataset_name)
+    if "tracemalloc_peak" in df.columns and df["tracemalloc_peak"].notna().any():
+        plot_dataset_memory(df, dataset_name, "tracemalloc_peak", "tracemalloc")
 
 
 def process_files_in_folder():
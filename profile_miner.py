@@ -0,0 +1,45 @@
+import os
+import sys
+from frequent_itemset_miner import apriori_no_pruning, apriori_pruning, eclat, write_stats
+
+ALGORITHMS = {
+    "eclat": eclat,
+    "apriori_pruning": apriori_pruning,
+    "apriori_no_pruning": apriori_no_pruning,
+}
+RESULTS_DIR = "results_experiment/stats"
+
+def profile_miner(dataset, threshold, algorithm):
+    """
+    Mines a dataset with the statistics of the algorithm enabled, prints those of each level (Apriori) or depth
+    (ECLAT), and saves all of them in a JSON file.
+
+    :param str dataset: Name of the dataset
+    :param float threshold: Minimum frequency
+    :param str algorithm: Name of the algorithm, key of ALGORITHMS
+    """
+    stats = {}
+    ALGORITHMS[algorithm](f"Datasets/{dataset}/{dataset}.dat", threshold, False, True, stats=stats)
+
+    if "levels" in stats:
+        print("level, generated, pruned, counted, kept, time")
+        for level_stats in stats["levels"]:
+            print(f"{level_stats['level']}, {level_stats['generated']}, {level_stats['pruned']}, "
+                  f"{level_stats['counted']}, {level_stats['kept']}, {level_stats['time']:.6f}")
+    else:
+        print("depth, nodes, intersections, avg_tidset_size")
+        for depth_stats in stats["depths"]:
+            average = depth_stats["tidset_size"] / depth_stats["intersections"] if depth_stats["intersections"] else 0
+            print(f"{depth_stats['depth']}, {depth_stats['nodes']}, {depth_stats['intersections']}, {average:.1f}")
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = os.path.join(RESULTS_DIR, f"{dataset}_{threshold}_{algorithm}.json")
+    write_stats(stats, output_path)
+    print(f"Statistics saved to {output_path}")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[3] not in ALGORITHMS:
+        print(f"Usage: python profile_miner.py <dataset_name> <threshold> <{'|'.join(ALGORITHMS)}>")
+        sys.exit(1)
+
+    profile_miner(sys.argv[1], float(sys.argv[2]), sys.argv[3])
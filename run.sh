@@ -12,8 +12,7 @@ run_command() {
     echo "" | tee -a $LOG_FILE
 }
 
-run_command "python run_experiment.py retail" 5
-run_command "python run_experiment.py pumsb" 5
-run_command "python run_experiment.py mushroom" 5
+# Add --resume to continue an interrupted run, without running again the runs already saved
+run_command "python run_experiment.py retail,pumsb,mushroom 5 --jobs 4 --pin"
 
 echo "All experiments completed. Check $LOG_FILE for details."
@@ -2,100 +2,417 @@ import sys
 import time
 import csv
 import os
+import signal
+import threading
 import multiprocessing
 import numpy as np
 import psutil
 from tqdm import tqdm
-from frequent_itemset_miner import apriori_no_pruning, apriori_pruning, eclat
+import frequent_itemset_miner
+from frequent_itemset_miner import apriori_bitmap, apriori_no_pruning, apriori_pruning, eclat, eclat_bitset, eclat_closed, eclat_diffset, eclat_maximal, eclat_parallel, eclat_spill, fp_growth, partition_miner, sweep, toivonen
 
-ALGORITHMS = ["eclat", "apriori_pruning", "apriori_no_pruning"]
+ALGORITHMS = {
+    "eclat": eclat,
+    "eclat_bitset": eclat_bitset,
+    "eclat_diffset": eclat_diffset,
+    "eclat_parallel": eclat_parallel,
+    "eclat_closed": eclat_closed,
+    "eclat_maximal": eclat_maximal,
+    "toivonen": toivonen,
+    "partition": partition_miner,
+    "eclat_spill": eclat_spill,
+    "fp_growth": fp_growth,
+    "apriori_pruning": apriori_pruning,
+    "apriori_bitmap": apriori_bitmap,
+    "apriori_no_pruning": apriori_no_pruning,
+}
 THRESHOLDS = [0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.15, 0.1, 0.05, 0.01, 0.005, 0.001]
 # THRESHOLDS = [0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1]
 # THRESHOLDS = [0.5, 0.1, 0.05, 0.01, 0.005, 0.001]
+PARALLEL_ALGORITHMS = {"eclat_parallel"}  # Algorithms starting one worker per CPU, run alone by `schedule_experiments`
+SWEEP_ALGORITHMS = ["eclat", "eclat_bitset", "eclat_diffset", "fp_growth", "apriori_pruning", "apriori_no_pruning"]
 RESULTS_DIR = "results_experiment"
 TIMEOUT_LIMIT = 1000
+MEMORY_SAMPLING_INTERVAL = 0.01  # Time between two samples of the RSS by `PeakMemorySampler`, in seconds
+TERMINATE_GRACE_PERIOD = 5  # Time given to a timed out run to release its resources before it is killed, in seconds
+MEASURES = ["max_memory", "ru_maxrss", "tracemalloc_peak", "parse_time", "mining_time", "output_time"]
+
+class PeakMemorySampler(threading.Thread):
+    """
+    Thread sampling the RSS of the current process and of the processes it started (the workers of `eclat_parallel` or
+    of Apriori), to catch their peak while an algorithm runs rather than only their value before and after. The pages
+    shared by several of them (e.g. the shared memory of `eclat_parallel`) are counted once per process using them.
+    """
+
+    def __init__(self, interval=MEMORY_SAMPLING_INTERVAL):
+        super().__init__(daemon=True)
+        self.process = psutil.Process(os.getpid())
+        self.interval = interval
+        self.peak = self.get_rss()
+        self.stopped = threading.Event()
+
+    def get_rss(self):
+        """Returns the total RSS of the process and of its children, in bytes"""
+        rss = self.process.memory_info().rss
+        for child in self.process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.NoSuchProcess:
+                pass
+        return rss
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.peak = max(self.peak, self.get_rss())
+
+    def stop(self):
+        """Stops the sampling, and returns the peak RSS in MB"""
+        self.stopped.set()
+        self.join()
+        self.peak = max(self.peak, self.get_rss())
+        return self.peak / (1024 * 1024)
+
+def get_ru_maxrss():
+    """
+    Returns the peak RSS reported by the kernel, in MB, or NaN where `resource` is missing: the largest of the peak of
+    the current process and of the peaks of the children it has waited for (the workers of `eclat_parallel` or of
+    Apriori), which, unlike `PeakMemorySampler`, does not add up the workers running at once.
+    With a forked process, it is at least the RSS of the parent when it was forked.
+    """
+    try:
+        import resource
+    except ImportError:
+        return np.nan
+    ru_maxrss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                    resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return ru_maxrss / (1024 * 1024) if sys.platform == "darwin" else ru_maxrss / 1024
 
 def setup_results_file(dataset):
     filename = f"{RESULTS_DIR}/{dataset}.csv"
     os.makedirs(RESULTS_DIR, exist_ok=True)
     with open(filename, mode="w", newline="") as file:
         writer = csv.writer(file)
-        writer.writerow(["run", "algorithm", "threshold", "time", "max_memory"])
+        writer.writerow(["run", "algorithm", "threshold", "time"] + MEASURES)
+    return filename
+
+def save_results(filename, run, algorithm, threshold, elapsed_time, measures):
+    """
+    Appends a run to the results file. `measures` maps the names in `MEASURES` to their values, and is NaN when the
+    run timed out.
+    """
+    if not isinstance(measures, dict):
+        measures = {}
+    with open(filename, mode="a", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow([run, algorithm, threshold, round(elapsed_time, 6)] +
+                        [round(measures.get(measure, np.nan), 6 if measure.endswith("_time") else 2)
+                         for measure in MEASURES])
+
+def setup_sweep_results_file(dataset):
+    filename = f"{RESULTS_DIR}/{dataset}_sweep.csv"
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    with open(filename, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["run", "algorithm", "threshold", "mining_threshold", "mining_time", "filter_time", "max_memory"])
     return filename
 
-def save_results(filename, run, algorithm, threshold, elapsed_time, max_memory):
+def save_sweep_results(filename, run, algorithm, threshold, mining_threshold, mining_time, filter_time, max_memory):
     with open(filename, mode="a", newline="") as file:
         writer = csv.writer(file)
-        writer.writerow([run, algorithm, threshold, round(elapsed_time, 6), round(max_memory, 2)])
+        writer.writerow([run, algorithm, threshold, mining_threshold, round(mining_time, 6), round(filter_time, 6),
+                         round(max_memory, 2)])
+
+def isolate_process():
+    """
+    Makes the current process, started to run an algorithm, the leader of a new process group, which the processes it
+    starts (the workers of `eclat_parallel` or of Apriori) join, so that they can be killed along with it (see
+    `terminate_process_tree`). SIGTERM then exits the process as `sys.exit` does, so that the algorithm stops its
+    workers and frees its shared memory on the way out.
+    """
+    if hasattr(os, "setpgrp"):
+        os.setpgrp()
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
 
-def algorithm_wrapper(target_func, args, queue):
+def terminate_process_tree(process, grace_period=TERMINATE_GRACE_PERIOD):
     """
-    Wrapper function to run the algorithm, measure time, and track memory usage.
-    It puts the elapsed time and max memory usage in the queue.
+    Terminates a process started to run an algorithm, along with the processes it started. The process is sent SIGTERM
+    first, on which it cleans up after itself (see `isolate_process`), then whatever is left of its process group after
+    `grace_period` seconds is killed, in case it hangs or a worker outlived it.
     """
-    process = psutil.Process(os.getpid())  # Get current process
-    mem_before = process.memory_info().rss / (1024 * 1024)  # Convert to MB
+    process.terminate()
+    process.join(grace_period)
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    process.join()
 
+def algorithm_wrapper(target_func, args, queue, use_tracemalloc=False, cpus=None):
+    """
+    Wrapper function to run the algorithm, measure time, and track memory usage, bound to the CPUs `cpus` if given.
+    It puts the elapsed time and the measures in the queue: the peak RSS of the process and its workers sampled while
+    the algorithm runs ("max_memory", see `PeakMemorySampler`), the peak RSS reported by the kernel ("ru_maxrss", see
+    `get_ru_maxrss`), the peak size of the Python allocations if `use_tracemalloc` is set ("tracemalloc_peak"), all
+    in MB, and the time spent reading the transactions ("parse_time"), writing the itemsets ("output_time") and mining
+    them ("mining_time", the rest of the time).
+    The standard output is sent to `os.devnull`, so that the algorithm can be run with `is_inginious` set: the output
+    time is then the time spent formatting and writing the itemsets, without the cost of a terminal.
+    """
+    import tracemalloc
+
+    isolate_process()
+    if cpus is not None:
+        os.sched_setaffinity(0, cpus)
+    frequent_itemset_miner.PHASE_TIMES = {}
+    if use_tracemalloc:
+        tracemalloc.start()
+    sampler = PeakMemorySampler()
+    sampler.start()
+
+    sys.stdout = open(os.devnull, "w")
     start_time = time.time()
     target_func(*args)
+    sys.stdout.flush()
     elapsed_time = time.time() - start_time
 
-    mem_after = process.memory_info().rss / (1024 * 1024)  # Convert to MB
-    max_memory = max(mem_before, mem_after)
+    measures = {"max_memory": sampler.stop(), "ru_maxrss": get_ru_maxrss(), "tracemalloc_peak": np.nan}
+    if use_tracemalloc:
+        measures["tracemalloc_peak"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    phase_times = frequent_itemset_miner.PHASE_TIMES
+    measures["parse_time"] = phase_times.get("parse", 0)
+    measures["output_time"] = phase_times.get("output", 0)
+    measures["mining_time"] = elapsed_time - measures["parse_time"] - measures["output_time"]
 
-    queue.put((elapsed_time, max_memory))
+    queue.put((elapsed_time, measures))
 
-def run_algorithm_with_timeout(target_func, args, timeout):
+def sweep_wrapper(target_func, args, queue):
+    """
+    Wrapper function to run a sweep over several thresholds and track memory usage.
+    It puts the timings returned by the sweep and the peak RSS sampled while it runs in the queue.
+    """
+    isolate_process()
+    sampler = PeakMemorySampler()
+    sampler.start()
+
+    timings = target_func(*args)
+
+    queue.put((timings, sampler.stop()))
+
+def run_algorithm_with_timeout(target_func, args, timeout, wrapper=algorithm_wrapper, wrapper_args=()):
     """
     Runs the given function with a timeout. If it exceeds `timeout` seconds, 
-    the process is terminated and `NaN` is returned.
+    the process and its workers are terminated and `NaN` is returned.
     """
     queue = multiprocessing.Queue()
-    process = multiprocessing.Process(target=algorithm_wrapper, args=(target_func, args, queue))
+    process = multiprocessing.Process(target=wrapper, args=(target_func, args, queue) + tuple(wrapper_args))
     process.start()
     process.join(timeout)
 
     if process.is_alive():
-        process.terminate()
-        process.join()
+        terminate_process_tree(process)
         return np.nan, np.nan
 
     return queue.get() if not queue.empty() else (np.nan, np.nan)
 
-def run_experiments(dataset, num_runs=5):
-    results_file = setup_results_file(dataset)
-    has_timeout_already = [False, False, False]
-
-    for threshold in THRESHOLDS:
-        for algorithm in tqdm(ALGORITHMS, desc=f"Running experiment for `{threshold}` on `{dataset}`"):
-            for run in range(1, num_runs + 1):
-                algorithm_func = None
-
-                if algorithm == "apriori_no_pruning" and not has_timeout_already[2]:
-                    algorithm_func = apriori_no_pruning
-                elif algorithm == "apriori_pruning" and not has_timeout_already[1]:
-                    algorithm_func = apriori_pruning
-                elif algorithm == "eclat" and not has_timeout_already[0]:
-                    algorithm_func = eclat
-
-                if algorithm_func is not None:
-                    elapsed_time, max_memory = run_algorithm_with_timeout(
-                        algorithm_func, 
-                        (f"Datasets/{dataset}/{dataset}.dat", threshold, False, True), 
-                        TIMEOUT_LIMIT
-                    )
-                    save_results(results_file, run, algorithm, threshold, elapsed_time, max_memory)
-                    if np.isnan(elapsed_time):
-                        has_timeout_already[ALGORITHMS.index(algorithm)] = True
+def load_completed_runs(filename):
+    """
+    Reads the runs already saved in a results file, to resume an interrupted experiment.
+    Returns a dictionary mapping each (algorithm, threshold, run) to whether it timed out.
+    """
+    completed = {}
+    with open(filename, newline="") as file:
+        reader = csv.reader(file)
+        if next(reader, None) != ["run", "algorithm", "threshold", "time"] + MEASURES:
+            raise ValueError(f"Cannot resume from `{filename}`, whose columns are not the current ones")
+        for row in reader:
+            completed[(row[1], float(row[2]), int(row[0]))] = np.isnan(float(row[3]))
+    return completed
+
+def get_cpus(jobs, pin):
+    """
+    Returns the CPUs of the `jobs` concurrent runs, which are only bound to them if `pin` is set.
+    """
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count()))
+    if pin and not hasattr(os, "sched_setaffinity"):
+        raise ValueError("Binding the runs to CPUs is not supported on this platform")
+    if pin and jobs > len(cpus):
+        raise ValueError(f"Cannot bind {jobs} concurrent runs to {len(cpus)} CPUs")
+    return cpus[:jobs] if pin else list(range(jobs))
+
+def schedule_experiments(datasets, num_runs=5, jobs=1, pin=False, resume=False, use_tracemalloc=False):
+    """
+    Runs every algorithm on every dataset, for every threshold and run, with up to `jobs` runs at once, each in a
+    fresh process, which prints the itemsets to `os.devnull` so that writing them is timed (see `algorithm_wrapper`).
+
+    The thresholds of a (dataset, algorithm) pair are run from the highest: the runs of a threshold start once those
+    of the previous one are done, and once a run times out, the remaining runs of the pair are skipped and saved as
+    NaN. Every run is saved as soon as it is done, so that with `resume`, the runs already in the results files are
+    not run again. With `pin`, each run is bound to its own CPU, so that concurrent runs do not share a core.
+
+    The runs of `PARALLEL_ALGORITHMS` start as many workers as they have CPUs, so they are run alone: they wait for
+    the other runs to end, and take all the CPUs of the `jobs` runs (bound to them with `pin`) until they end.
+    """
+    import collections
+    from multiprocessing.connection import wait
+
+    free_cpus = get_cpus(jobs, pin)
+    results_files = {}
+    completed = {}
+    for dataset in datasets:
+        results_files[dataset] = f"{RESULTS_DIR}/{dataset}.csv"
+        if resume and os.path.exists(results_files[dataset]):
+            for (algorithm, threshold, run), timed_out in load_completed_runs(results_files[dataset]).items():
+                completed[(dataset, algorithm, threshold, run)] = timed_out
+        else:
+            setup_results_file(dataset)
+
+    pending = collections.deque()
+    runs_left = {}
+    thresholds_left = {(dataset, algorithm): list(THRESHOLDS) for dataset in datasets for algorithm in ALGORITHMS}
+    has_timeout_already = set()
+    progress = tqdm(total=len(thresholds_left) * len(THRESHOLDS) * num_runs - len(completed),
+                    desc=f"Running experiments on `{'`, `'.join(datasets)}`")
+
+    def finish_run(dataset, algorithm, threshold, run, elapsed_time, measures):
+        save_results(results_files[dataset], run, algorithm, threshold, elapsed_time, measures)
+        progress.update()
+        if np.isnan(elapsed_time):
+            has_timeout_already.add((dataset, algorithm))
+
+    def start_next_threshold(pair):
+        """Queues the runs of the next threshold of the pair, or saves them as NaN after a timeout"""
+        dataset, algorithm = pair
+        while thresholds_left[pair]:
+            threshold = thresholds_left[pair].pop(0)
+            if any(completed.get((dataset, algorithm, threshold, run)) for run in range(1, num_runs + 1)):
+                has_timeout_already.add(pair)
+            runs = [run for run in range(1, num_runs + 1) if (dataset, algorithm, threshold, run) not in completed]
+            if pair in has_timeout_already:
+                for run in runs:
+                    finish_run(dataset, algorithm, threshold, run, np.nan, np.nan)
+            elif runs:
+                pending.extend((dataset, algorithm, threshold, run) for run in runs)
+                runs_left[pair] = len(runs)
+                return
+
+    def end_run(pair):
+        runs_left[pair] -= 1
+        if runs_left[pair] == 0:
+            start_next_threshold(pair)
+
+    for pair in thresholds_left:
+        start_next_threshold(pair)
+
+    running = {}
+    while pending or running:
+        while pending and free_cpus:
+            dataset, algorithm, threshold, run = pending.popleft()
+            if (dataset, algorithm) in has_timeout_already:
+                finish_run(dataset, algorithm, threshold, run, np.nan, np.nan)
+                end_run((dataset, algorithm))
+                continue
+            if algorithm in PARALLEL_ALGORITHMS:
+                if running:
+                    pending.appendleft((dataset, algorithm, threshold, run))
+                    break
+                cpus, free_cpus = free_cpus, []
+            else:
+                cpus = [free_cpus.pop()]
+            queue = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=algorithm_wrapper,
+                args=(ALGORITHMS[algorithm], (f"Datasets/{dataset}/{dataset}.dat", threshold, True, True), queue,
+                      use_tracemalloc, set(cpus) if pin else None)
+            )
+            process.start()
+            running[process.sentinel] = ((dataset, algorithm, threshold, run), process, queue,
+                                         time.time() + TIMEOUT_LIMIT, cpus)
+        if not running:
+            continue
+
+        deadline = min(run_deadline for _, _, _, run_deadline, _ in running.values())
+        ready = wait(list(running), max(0, deadline - time.time()))
+        for sentinel in list(running):
+            (dataset, algorithm, threshold, run), process, queue, run_deadline, cpus = running[sentinel]
+            if sentinel in ready:
+                process.join()
+                elapsed_time, measures = queue.get() if not queue.empty() else (np.nan, np.nan)
+            elif time.time() >= run_deadline:
+                terminate_process_tree(process)
+                elapsed_time, measures = np.nan, np.nan
+            else:
+                continue
+            del running[sentinel]
+            free_cpus.extend(cpus)
+            finish_run(dataset, algorithm, threshold, run, elapsed_time, measures)
+            end_run((dataset, algorithm))
+    progress.close()
+
+def run_experiments(dataset, num_runs=5, use_tracemalloc=False):
+    schedule_experiments([dataset], num_runs, use_tracemalloc=use_tracemalloc)
+
+def run_sweep_experiments(dataset, num_runs=5):
+    """
+    Mines the dataset once per algorithm and run, at the lowest threshold that does not time out, and derives the
+    results of all the higher thresholds from it (see `sweep`). The shared mining time and the filtering time of each
+    threshold are saved separately.
+
+    The lowest threshold is found from the highest, adding one lower threshold at a time until the sweep times out, as
+    every threshold below one that times out does too. The last sweep that did not time out is the first run.
+    """
+    results_file = setup_sweep_results_file(dataset)
+    filepath = f"Datasets/{dataset}/{dataset}.dat"
+
+    for algorithm in tqdm(SWEEP_ALGORITHMS, desc=f"Running sweep experiment on `{dataset}`"):
+        thresholds = sorted(THRESHOLDS, reverse=True)
+        num_feasible = 0
+        result = (np.nan, np.nan)
+        while num_feasible < len(thresholds):
+            probe = run_algorithm_with_timeout(
+                sweep, (filepath, thresholds[:num_feasible + 1], algorithm, False, True), TIMEOUT_LIMIT,
+                wrapper=sweep_wrapper
+            )
+            if not isinstance(probe[0], dict):
+                break
+            result = probe
+            num_feasible += 1
+
+        for run in range(1, num_runs + 1):
+            if run > 1 and num_feasible:
+                result = run_algorithm_with_timeout(
+                    sweep, (filepath, thresholds[:num_feasible], algorithm, False, True), TIMEOUT_LIMIT,
+                    wrapper=sweep_wrapper
+                )
+            timings, max_memory = result
+            for threshold in thresholds:
+                if isinstance(timings, dict) and threshold in timings["filtering"]:
+                    save_sweep_results(results_file, run, algorithm, threshold, thresholds[num_feasible - 1],
+                                       timings["mining"], timings["filtering"][threshold], max_memory)
                 else:
-                    save_results(results_file, run, algorithm, threshold, np.nan, np.nan)
+                    save_sweep_results(results_file, run, algorithm, threshold, np.nan, np.nan, np.nan, np.nan)
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2 or len(sys.argv) > 3:
-        print("Usage: python run_experiments.py <dataset_name> <num_runs(optional, default=1)>")
-        sys.exit(1)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measures the algorithms on datasets, for every threshold.")
+    parser.add_argument("datasets", help="Name of the dataset, or comma-separated names of several datasets")
+    parser.add_argument("num_runs", nargs="?", type=int, default=5, help="Number of runs of each algorithm and threshold")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--sweep", action="store_true", help="Mine once per algorithm for all the thresholds")
+    mode.add_argument("--tracemalloc", action="store_true", help="Also measure the peak of the Python allocations")
+    parser.add_argument("--jobs", type=int, default=1, help="Number of runs at once")
+    parser.add_argument("--pin", action="store_true", help="Bind each concurrent run to its own CPU")
+    parser.add_argument("--resume", action="store_true", help="Skip the runs already saved in the results files")
+    args = parser.parse_args()
+
+    if args.sweep and (args.jobs != 1 or args.pin or args.resume):
+        parser.error("--jobs, --pin and --resume are not supported with --sweep")
 
-    if len(sys.argv) == 2:
-        run_experiments(sys.argv[1])
+    datasets = args.datasets.split(",")
+    if args.sweep:
+        for dataset in datasets:
+            run_sweep_experiments(dataset, args.num_runs)
     else:
-        run_experiments(sys.argv[1], int(sys.argv[2]))
+        schedule_experiments(datasets, args.num_runs, args.jobs, args.pin, args.resume, args.tracemalloc)
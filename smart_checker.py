@@ -54,10 +54,60 @@ def get_patterns_from_file(filename):
                     itemset = tuple(sorted([int(x) for x in g.group(1).split(', ')]))
                     patterns.add(itemset)
     return patterns if not has_errors else None
-    
-def compare_solution_files(expected_file, actual_file):
-    """Compare the output of the patterns in actual with the patterns in expected"""
-    expected_patterns = get_patterns_from_file(expected_file)
+
+def get_frequencies_from_file(filename):
+    """Map each pattern of the file to its frequency, or return None if a line has the wrong format"""
+    frequencies = {}
+    with open(filename) as f:
+        for line in f:
+            if line != "":
+                g = re.search("\[((?:\d+,? ?)+)\] *\((\d.\d+)\)", line.rstrip())
+                if g is None:
+                    print(f"[ERROR] The following line, from file {filename}, has the wrong format:")
+                    print(f"\t{line}")
+                    return None
+                itemset = tuple(sorted([int(x) for x in g.group(1).split(', ')]))
+                frequencies[itemset] = float(g.group(2))
+    return frequencies
+
+def get_closed_patterns(frequencies):
+    """Keep the patterns with no superset of the same frequency, which is enough to check on one more item"""
+    closed = set(frequencies)
+    for itemset, frequency in frequencies.items():
+        if len(itemset) > 1:
+            for i in range(len(itemset)):
+                subset = itemset[:i] + itemset[i+1:]
+                if frequencies.get(subset) == frequency:
+                    closed.discard(subset)
+    return closed
+
+def get_maximal_patterns(frequencies):
+    """Keep the patterns with no frequent superset, which is enough to check on one more item"""
+    maximal = set(frequencies)
+    for itemset in frequencies:
+        for i in range(len(itemset)):
+            maximal.discard(itemset[:i] + itemset[i+1:])
+    return maximal
+
+def get_expected_patterns(expected_file, mode):
+    """Read the patterns of a file of all the frequent itemsets, then keep the closed or maximal ones if asked"""
+    if mode == "all":
+        return get_patterns_from_file(expected_file)
+    frequencies = get_frequencies_from_file(expected_file)
+    if frequencies is None:
+        return None
+    return get_closed_patterns(frequencies) if mode == "closed" else get_maximal_patterns(frequencies)
+
+def get_mode(algorithm):
+    """Name of the itemsets output by the algorithm: "closed", "maximal" or "all" of them"""
+    for mode in ("closed", "maximal"):
+        if algorithm.endswith(f"_{mode}"):
+            return mode
+    return "all"
+
+def compare_solution_files(expected_file, actual_file, mode="all"):
+    """Compare the output of the patterns in actual with the (closed or maximal) patterns in expected"""
+    expected_patterns = get_expected_patterns(expected_file, mode)
     actual_patterns = get_patterns_from_file(actual_file)
     if expected_patterns is not None and actual_patterns is not None:
         missed = expected_patterns - actual_patterns
@@ -79,16 +129,17 @@ def compare_solution_files(expected_file, actual_file):
                 print(f"(Showed {len(to_show)} out of {len(excess)})")
 
 def run_comparisons(dataset_name, algorithm):
+    mode = get_mode(algorithm)
     if dataset_name == "all":
         for name, runs in DATASETS.items():
             print(f"\nChecking `{algorithm}` on `{name}` dataset:")
             for _, min_freq in runs:
-                compare_solution_files(f"solutions/sols/{name}_{min_freq}", f"solutions/{algorithm}/{name}_{min_freq}")
+                compare_solution_files(f"solutions/sols/{name}_{min_freq}", f"solutions/{algorithm}/{name}_{min_freq}", mode)
     
     elif dataset_name in DATASETS:
         print(f"\nChecking `{algorithm}` on `{dataset_name}` dataset:")
         for _, min_freq in DATASETS[dataset_name]:
-            compare_solution_files(f"solutions/sols/{dataset_name}_{min_freq}", f"solutions/{algorithm}/{dataset_name}_{min_freq}")
+            compare_solution_files(f"solutions/sols/{dataset_name}_{min_freq}", f"solutions/{algorithm}/{dataset_name}_{min_freq}", mode)
     else:
         print(f"Error: Unknown dataset '{dataset_name}'.")
         print("Available datasets:", ", ".join(DATASETS.keys()) + ", all")